@@ -1,15 +1,22 @@
 """Screenshot capture with region selection for Snag."""
 
+import atexit
+import functools
+import shutil
 import subprocess
 import sys
+import threading
 from io import BytesIO
-from typing import Optional
-
-import mss
-from PIL import Image
+from typing import TYPE_CHECKING, Optional
 
 from .platform import Platform, detect_platform
 
+# mss and Pillow are imported inside the capture functions to keep them
+# off the import path of commands that never take a screenshot
+if TYPE_CHECKING:
+    import mss.base
+    from PIL import Image
+
 
 class CaptureError(Exception):
     """Error during screenshot capture."""
@@ -23,9 +30,89 @@ class SelectionCancelled(Exception):
     pass
 
 
-def capture_region() -> Image.Image:
+# The dimmed overlay background is rendered at 1/N resolution and zoomed
+# back up by Tk; nobody can tell the difference on a darkened backdrop
+_PREVIEW_SCALE = 2
+
+# Per-channel lookup table dimming the overlay background to ~40% brightness.
+# Applied to the 4-channel BGRX preview, where Pillow maps whole pixels per
+# step; this is ~2x faster than dimming after the RGB conversion.
+_DIM_LUT = [int(i * 0.4) for i in range(256)] * 4
+
+# Minimum interval between selection redraws while dragging (~60 Hz)
+_DRAG_REDRAW_MS = 16
+
+# Shared mss instance, created on first use and closed at interpreter exit
+_sct: Optional["mss.base.MSSBase"] = None
+_sct_lock = threading.Lock()
+
+# Virtual screen bounds (left, top, width, height), see _virtual_screen()
+_monitor_cache: Optional[tuple[int, int, int, int]] = None
+
+
+def _get_sct() -> "mss.base.MSSBase":
+    """Return a cached mss instance, creating it on first use."""
+    global _sct
+    with _sct_lock:
+        if _sct is None:
+            import mss
+
+            _sct = mss.mss()
+            atexit.register(_close_sct)
+        return _sct
+
+
+def _close_sct() -> None:
+    """Close the cached mss instance."""
+    global _sct
+    with _sct_lock:
+        if _sct is not None:
+            _sct.close()
+            _sct = None
+
+
+def _virtual_screen(sct: "mss.base.MSSBase") -> tuple[int, int, int, int]:
+    """Return (left, top, width, height) of the full virtual screen.
+
+    Enumerating monitors queries the display server (XRandR on X11), so the
+    result is cached until invalidate_monitors() is called.
+    """
+    global _monitor_cache
+    if _monitor_cache is None:
+        # monitors[0] is the full virtual screen spanning all monitors
+        monitor = sct.monitors[0]
+        _monitor_cache = (
+            monitor["left"], monitor["top"], monitor["width"], monitor["height"]
+        )
+    return _monitor_cache
+
+
+def invalidate_monitors() -> None:
+    """Forget the cached screen layout (call after plugging/unplugging a display)."""
+    global _monitor_cache
+    _monitor_cache = None
+
+
+def _bgra_to_rgb(image: "Image.Image") -> "Image.Image":
+    """Convert an RGBX-mode image holding raw BGRA pixels to true RGB."""
+    from PIL import Image
+
+    b, g, r, _ = image.split()
+    return Image.merge("RGB", (r, g, b))
+
+
+@functools.lru_cache(maxsize=None)
+def _which(tool: str) -> Optional[str]:
+    """Resolve a command-line tool on PATH once per process."""
+    return shutil.which(tool)
+
+
+def capture_region(backend: str = "tk") -> "Image.Image":
     """Capture a region of the screen selected by the user.
 
+    Args:
+        backend: Overlay toolkit for X11/Windows ("tk" or "qt")
+
     Returns:
         PIL Image of the selected region
 
@@ -40,18 +127,23 @@ def capture_region() -> Image.Image:
     elif platform == Platform.MACOS:
         return _capture_macos()
     elif platform in (Platform.LINUX_X11, Platform.WINDOWS):
+        if backend == "qt":
+            from .capture_qt import capture_with_overlay_qt
+
+            return capture_with_overlay_qt()
         return _capture_with_overlay()
     else:
         raise CaptureError(f"Unsupported platform: {platform}")
 
 
-def _capture_wayland() -> Image.Image:
+def _capture_wayland() -> "Image.Image":
     """Capture region on Wayland using slurp + grim."""
+    from PIL import Image
+
     # Check for required tools
-    try:
-        subprocess.run(["which", "slurp"], check=True, capture_output=True)
-        subprocess.run(["which", "grim"], check=True, capture_output=True)
-    except subprocess.CalledProcessError:
+    slurp = _which("slurp")
+    grim = _which("grim")
+    if not (slurp and grim):
         raise CaptureError(
             "Wayland capture requires 'slurp' and 'grim'.\n"
             "Install with: sudo apt install slurp grim  # Debian/Ubuntu\n"
@@ -61,7 +153,7 @@ def _capture_wayland() -> Image.Image:
     # Get region selection with slurp
     try:
         result = subprocess.run(
-            ["slurp"], capture_output=True, text=True, check=True
+            [slurp], capture_output=True, text=True, check=True
         )
         region = result.stdout.strip()
     except subprocess.CalledProcessError:
@@ -70,22 +162,29 @@ def _capture_wayland() -> Image.Image:
     if not region:
         raise SelectionCancelled()
 
-    # Capture region with grim
+    # Capture region with grim. PPM is uncompressed, so neither grim nor
+    # Pillow spends time in zlib.
+    result = subprocess.run(
+        [grim, "-t", "ppm", "-g", region, "-"],
+        capture_output=True,
+    )
+    if result.returncode != 0:
+        stderr = result.stderr.decode(errors="replace").strip()
+        raise CaptureError(f"grim capture failed: {stderr or result.returncode}")
     try:
-        result = subprocess.run(
-            ["grim", "-g", region, "-"],
-            capture_output=True,
-            check=True,
-        )
-        return Image.open(BytesIO(result.stdout))
-    except subprocess.CalledProcessError as e:
+        image = Image.open(BytesIO(result.stdout))
+        image.load()
+    except Exception as e:
         raise CaptureError(f"grim capture failed: {e}")
+    return image
 
 
-def _capture_macos() -> Image.Image:
+def _capture_macos() -> "Image.Image":
     """Capture region on macOS using native screencapture with interactive selection."""
     import tempfile
 
+    from PIL import Image
+
     # Create temp file for screenshot
     with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
         temp_path = f.name
@@ -115,28 +214,32 @@ def _capture_macos() -> Image.Image:
             pass
 
 
-def _capture_with_overlay() -> Image.Image:
+def _capture_with_overlay() -> "Image.Image":
     """Capture region using mss + tkinter overlay for X11/Windows/macOS."""
     import tkinter as tk
 
-    from PIL import ImageEnhance, ImageTk
-    from pynput import keyboard
+    from PIL import Image
 
     # First, take a full screenshot of ALL monitors
-    with mss.mss() as sct:
-        # monitors[0] is the full virtual screen spanning all monitors
-        monitor = sct.monitors[0]
-        screenshot = sct.grab(monitor)
-        full_image = Image.frombytes("RGB", screenshot.size, screenshot.bgra, "raw", "BGRX")
-
-    # Get the virtual screen bounds (may have negative coordinates for left monitors)
-    screen_x = monitor["left"]
-    screen_y = monitor["top"]
-    screen_width = monitor["width"]
-    screen_height = monitor["height"]
+    sct = _get_sct()
+    # Virtual screen bounds (may have negative coordinates for left monitors)
+    screen_x, screen_y, screen_width, screen_height = _virtual_screen(sct)
+    screenshot = sct.grab({
+        "left": screen_x,
+        "top": screen_y,
+        "width": screen_width,
+        "height": screen_height,
+    })
+    # Wrap the raw BGRA buffer without copying; channels are only swapped
+    # to RGB for the darkened preview and the final (much smaller) crop.
+    # RGBX, not RGBA: mss's alpha byte is often 0, and reduce() would
+    # premultiply by it and turn the preview black.
+    screen_bgra = Image.frombuffer(
+        "RGBX", screenshot.size, screenshot.raw, "raw", "RGBX", 0, 1
+    )
 
-    # Create darkened version for display (reduce brightness to ~40%)
-    darkened = ImageEnhance.Brightness(full_image).enhance(0.4)
+    # Create darkened, downscaled version for display (brightness ~40%)
+    darkened = _bgra_to_rgb(screen_bgra.reduce(_PREVIEW_SCALE).point(_DIM_LUT))
 
     # Create selection overlay
     selection = {"start": None, "end": None, "cancelled": True}
@@ -149,8 +252,14 @@ def _capture_with_overlay() -> Image.Image:
     # Position window to cover ALL monitors (including negative coordinates)
     root.geometry(f"{screen_width}x{screen_height}+{screen_x}+{screen_y}")
 
-    # Convert darkened screenshot to PhotoImage
-    photo = ImageTk.PhotoImage(darkened)
+    # Hand the darkened screenshot to Tk as a binary PPM (no ImageTk
+    # conversion pass) and zoom it to full size on the Tk side, so only the
+    # small preview crosses the PIL/Tk boundary
+    ppm = b"P6\n%d %d\n255\n" % darkened.size + darkened.tobytes()
+    photo = tk.PhotoImage(master=root, data=ppm, format="PPM").zoom(_PREVIEW_SCALE)
+    # Tk now owns the pixels; drop the Python-side preview copies so only
+    # mss's raw buffer stays alive while the user is selecting
+    del darkened, ppm
 
     canvas = tk.Canvas(
         root,
@@ -169,63 +278,80 @@ def _capture_with_overlay() -> Image.Image:
         selection["cancelled"] = True
         root.quit()
 
-    # For selection rectangle - use two rectangles for better visibility
-    rect_border = None
-    rect_inner = None
+    # Selection outline: four line segments per colour rather than two
+    # rectangles, so each drag only redraws the edges, not the whole area
+    border_lines: list[int] = []
+    inner_lines: list[int] = []
+
+    # Selection start in canvas coordinates, set on press
+    drag_start = None
+
+    def set_outline(lines, x1, y1, x2, y2, coords=canvas.coords):
+        # Bound as a default argument: a fast local lookup in the drag path
+        top, right, bottom, left = lines
+        coords(top, x1, y1, x2, y1)
+        coords(right, x2, y1, x2, y2)
+        coords(bottom, x1, y2, x2, y2)
+        coords(left, x1, y1, x1, y2)
 
     def on_mouse_press(event):
-        nonlocal rect_border, rect_inner
+        nonlocal border_lines, inner_lines, drag_pos, drag_start
+        drag_pos = None
+        drag_start = (event.x, event.y)
         # Store absolute screen coordinates
         selection["start"] = (event.x_root, event.y_root)
         selection["cancelled"] = False
-        if rect_border:
-            canvas.delete(rect_border)
-            canvas.delete(rect_inner)
+        for line in border_lines + inner_lines:
+            canvas.delete(line)
         # Black outer border for contrast
-        rect_border = canvas.create_rectangle(
-            event.x, event.y, event.x, event.y,
-            outline="black", width=3
-        )
+        border_lines = [
+            canvas.create_line(
+                event.x, event.y, event.x, event.y,
+                fill="black", width=3, capstyle=tk.PROJECTING
+            )
+            for _ in range(4)
+        ]
         # White inner border
-        rect_inner = canvas.create_rectangle(
-            event.x, event.y, event.x, event.y,
-            outline="white", width=1
-        )
+        inner_lines = [
+            canvas.create_line(
+                event.x, event.y, event.x, event.y,
+                fill="white", width=1, capstyle=tk.PROJECTING
+            )
+            for _ in range(4)
+        ]
+
+    # Motion events can arrive far faster than the display refreshes, so
+    # only remember the latest pointer position and redraw once per frame
+    drag_pos = None
+    drag_after_id = None
+
+    def flush_drag():
+        nonlocal drag_after_id
+        drag_after_id = None
+        if drag_start and drag_pos:
+            x1, y1 = drag_start
+            x2, y2 = drag_pos
+            set_outline(border_lines, x1, y1, x2, y2)
+            set_outline(inner_lines, x1, y1, x2, y2)
 
     def on_mouse_drag(event):
-        nonlocal rect_border, rect_inner
-        if selection["start"] and rect_border:
-            # Convert start position to canvas coordinates
-            x1 = selection["start"][0] - screen_x
-            y1 = selection["start"][1] - screen_y
-            canvas.coords(rect_border, x1, y1, event.x, event.y)
-            canvas.coords(rect_inner, x1, y1, event.x, event.y)
+        nonlocal drag_pos, drag_after_id
+        drag_pos = (event.x, event.y)
+        if drag_after_id is None:
+            drag_after_id = root.after(_DRAG_REDRAW_MS, flush_drag)
 
     def on_mouse_release(event):
+        if drag_after_id is not None:
+            root.after_cancel(drag_after_id)
         selection["end"] = (event.x_root, event.y_root)
         root.quit()
 
     def on_right_click(event):
         cancel()
 
-    # Global keyboard listener using pynput (captures keys regardless of focus)
-    def on_key_press(key):
-        if key == keyboard.Key.esc:
-            # Schedule cancel on main thread
-            root.after(0, cancel)
-            return False  # Stop listener
-        # Also check for 'q' key
-        try:
-            if key.char == 'q':
-                root.after(0, cancel)
-                return False
-        except AttributeError:
-            pass
-        return True
-
-    # Start keyboard listener in background thread
-    kb_listener = keyboard.Listener(on_press=on_key_press)
-    kb_listener.start()
+    # Keyboard shortcuts to cancel (Escape or q)
+    root.bind_all("<Escape>", lambda event: cancel())
+    root.bind_all("q", lambda event: cancel())
 
     # Bind mouse events to canvas
     canvas.bind("<ButtonPress-1>", on_mouse_press)
@@ -233,10 +359,18 @@ def _capture_with_overlay() -> Image.Image:
     canvas.bind("<ButtonRelease-1>", on_mouse_release)
     canvas.bind("<ButtonPress-3>", on_right_click)  # Right-click to cancel
 
+    # Override-redirect windows are never focused by the window manager, so
+    # take keyboard focus (and grab input) explicitly once we are visible
+    root.wait_visibility(root)
+    root.focus_force()
+    try:
+        root.grab_set_global()
+    except tk.TclError:
+        pass
+
     root.mainloop()
 
     # Cleanup
-    kb_listener.stop()
     root.destroy()
 
     if selection["cancelled"] or not selection["start"] or not selection["end"]:
@@ -259,4 +393,4 @@ def _capture_with_overlay() -> Image.Image:
     img_y2 = y2 - screen_y
 
     # Crop the ORIGINAL (non-darkened) screenshot
-    return full_image.crop((img_x1, img_y1, img_x2, img_y2))
+    return _bgra_to_rgb(screen_bgra.crop((img_x1, img_y1, img_x2, img_y2)))
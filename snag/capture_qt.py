@@ -0,0 +1,145 @@
+"""Qt (PySide6) region selection overlay for Snag.
+
+Optional alternative to the tkinter overlay for X11/Windows. The dimmed
+screenshot is painted once into a pixmap and Qt only repaints the damaged
+strip around the selection rectangle, which stays smooth on large
+multi-monitor setups. Requires PySide6 (``snag[qt]``).
+"""
+
+import os
+from typing import TYPE_CHECKING
+
+from .capture import (
+    CaptureError,
+    SelectionCancelled,
+    _bgra_to_rgb,
+    _get_sct,
+    _virtual_screen,
+)
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+
+def capture_with_overlay_qt() -> "Image.Image":
+    """Capture region using mss + a PySide6 overlay for X11/Windows."""
+    # mss grabs physical pixels; keep Qt's coordinates in the same space
+    os.environ.setdefault("QT_ENABLE_HIGHDPI_SCALING", "0")
+
+    try:
+        from PySide6.QtCore import QRect, Qt
+        from PySide6.QtGui import QColor, QImage, QPainter, QPen, QPixmap
+        from PySide6.QtWidgets import QApplication, QWidget
+    except ImportError:
+        raise CaptureError(
+            "The Qt overlay requires PySide6.\n"
+            "Install with: uv tool install 'snag[qt] @ git+https://github.com/am-will/snag.git'"
+        )
+    from PIL import Image
+
+    # First, take a full screenshot of ALL monitors
+    sct = _get_sct()
+    screen_x, screen_y, screen_width, screen_height = _virtual_screen(sct)
+    screenshot = sct.grab({
+        "left": screen_x,
+        "top": screen_y,
+        "width": screen_width,
+        "height": screen_height,
+    })
+
+    app = QApplication.instance() or QApplication([])
+
+    # mss's BGRA buffer is exactly Qt's RGB32 layout, so wrap it directly
+    # and bake the dimming into the pixmap once (~40% brightness)
+    qimage = QImage(
+        screenshot.raw, screen_width, screen_height, screen_width * 4,
+        QImage.Format.Format_RGB32,
+    )
+    background = QPixmap.fromImage(qimage)
+    painter = QPainter(background)
+    painter.fillRect(background.rect(), QColor(0, 0, 0, 153))
+    painter.end()
+
+    selection = {"start": None, "end": None, "cancelled": True}
+
+    class Overlay(QWidget):
+        def __init__(self) -> None:
+            super().__init__()
+            self.setWindowFlags(
+                Qt.WindowType.FramelessWindowHint
+                | Qt.WindowType.WindowStaysOnTopHint
+                | Qt.WindowType.Tool
+            )
+            self.setCursor(Qt.CursorShape.CrossCursor)
+            self.setGeometry(screen_x, screen_y, screen_width, screen_height)
+            self.rect_now = QRect()
+
+        def _set_rect(self, rect: QRect) -> None:
+            # Repaint only the area covered by the old and new outlines
+            damaged = self.rect_now.united(rect).adjusted(-3, -3, 3, 3)
+            self.rect_now = rect
+            self.update(damaged)
+
+        def paintEvent(self, event) -> None:
+            p = QPainter(self)
+            p.drawPixmap(event.rect(), background, event.rect())
+            if not self.rect_now.isNull():
+                # Black outer border for contrast, white inner border
+                p.setPen(QPen(QColor("black"), 3))
+                p.drawRect(self.rect_now)
+                p.setPen(QPen(QColor("white"), 1))
+                p.drawRect(self.rect_now)
+            p.end()
+
+        def mousePressEvent(self, event) -> None:
+            if event.button() == Qt.MouseButton.RightButton:
+                self._cancel()
+                return
+            pos = event.position().toPoint()
+            selection["start"] = (pos.x(), pos.y())
+            selection["cancelled"] = False
+            self._set_rect(QRect(pos, pos))
+
+        def mouseMoveEvent(self, event) -> None:
+            if selection["start"]:
+                pos = event.position().toPoint()
+                x1, y1 = selection["start"]
+                self._set_rect(QRect(x1, y1, pos.x() - x1, pos.y() - y1).normalized())
+
+        def mouseReleaseEvent(self, event) -> None:
+            if event.button() == Qt.MouseButton.LeftButton and selection["start"]:
+                pos = event.position().toPoint()
+                selection["end"] = (pos.x(), pos.y())
+                self.close()
+
+        def keyPressEvent(self, event) -> None:
+            if event.key() in (Qt.Key.Key_Escape, Qt.Key.Key_Q):
+                self._cancel()
+
+        def _cancel(self) -> None:
+            selection["cancelled"] = True
+            self.close()
+
+    overlay = Overlay()
+    overlay.show()
+    overlay.activateWindow()
+    overlay.raise_()
+    app.exec()
+
+    if selection["cancelled"] or not selection["start"] or not selection["end"]:
+        raise SelectionCancelled()
+
+    # Coordinates are already relative to the screenshot origin
+    x1 = min(selection["start"][0], selection["end"][0])
+    y1 = min(selection["start"][1], selection["end"][1])
+    x2 = max(selection["start"][0], selection["end"][0])
+    y2 = max(selection["start"][1], selection["end"][1])
+
+    # Ensure we have a valid region
+    if x2 - x1 < 5 or y2 - y1 < 5:
+        raise SelectionCancelled()
+
+    screen_bgra = Image.frombuffer(
+        "RGBX", screenshot.size, screenshot.raw, "raw", "RGBX", 0, 1
+    )
+    return _bgra_to_rgb(screen_bgra.crop((x1, y1, x2, y2)))
@@ -1,18 +1,33 @@
 """Configuration management for Snag."""
 
+import functools
+import json
+import os
+import re
 import sys
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
-# Use tomllib (3.11+) or tomli for TOML reading
-if sys.version_info >= (3, 11):
-    import tomllib
-else:
-    import tomli as tomllib
+# Home directory, looked up once for all config paths
+_HOME = Path.home()
 
-CONFIG_DIR = Path.home() / ".config" / "snag"
+CONFIG_DIR = _HOME / ".config" / "snag"
 CONFIG_FILE = CONFIG_DIR / "config.toml"
+# JSON copy of config.toml written by save_config(), so startup can skip tomllib
+CONFIG_CACHE_FILE = CONFIG_DIR / "config.cache.json"
 ENV_FILE = CONFIG_DIR / ".env"
+# Vision responses cached by image content (see vision.py)
+CACHE_DIR = _HOME / ".cache" / "snag"
+
+# Standard config locations for .env file
+# Priority: ~/.config/snag/.env > ~/.snag.env > ./.env
+# (./.env stays relative: resolved against the working directory when it is
+# read, so importing this module needs no getcwd() call)
+ENV_LOCATIONS = [
+    ENV_FILE,
+    _HOME / ".snag.env",
+    Path(".env"),
+]
 
 # Defaults
 DEFAULT_PROVIDER = "google"
@@ -31,21 +46,120 @@ GOOGLE_MODELS = {
     },
 }
 
+# KEY=value lines of a .env file, with an optional "export " prefix (comments
+# and blank lines never match). Following python-dotenv, a value is either
+# fully quoted ("..." or '...', may span lines, may be followed by a
+# comment) or unquoted (ends at the line, " #" starts a comment). A line
+# with an unterminated quote is skipped.
+_ENV_LINE_RE = re.compile(
+    r"""^[ \t]*(?:export[ \t]+)?([^#=\s][^=\n]*?)[ \t]*=[ \t]*"""
+    r"""(?:"((?:[^"\\]|\\.)*)"[^\S\n]*(?:#[^\n]*)?$"""
+    r"""|'((?:[^'\\]|\\.)*)'[^\S\n]*(?:#[^\n]*)?$"""
+    r"""|([^\n]*)$)""",
+    re.MULTILINE | re.DOTALL,
+)
+_ENV_COMMENT_RE = re.compile(r"\s+#.*")
+
+# Backslash escapes understood inside double and single quotes
+_ENV_DOUBLE_ESCAPE_RE = re.compile(r"""\\([\\'"abfnrtv])""")
+_ENV_SINGLE_ESCAPE_RE = re.compile(r"""\\([\\'])""")
+_ENV_ESCAPES = {
+    "\\": "\\", "'": "'", '"': '"', "a": "\a", "b": "\b",
+    "f": "\f", "n": "\n", "r": "\r", "t": "\t", "v": "\v",
+}
+
+# Parsed config keyed by the config file's stamp, reset by save_config()
+_config_cache: Optional[tuple[list[int], dict[str, Any]]] = None
+
+
+@functools.lru_cache(maxsize=8)
+def _read_env_text(path: str, mtime_ns: int) -> str:
+    """Read a .env file, cached per path and modification time."""
+    return Path(path).read_text()
+
+
+def read_env_text(path: Path) -> Optional[str]:
+    """Return the contents of a .env file, or None if it does not exist.
+
+    The CLI checks and the vision module's env loading share this cache, so
+    each .env file is read at most once per process.
+    """
+    # EAFP: one stat for a missing file, no separate exists() check, and an
+    # unreadable file is treated the same as a missing one
+    try:
+        return _read_env_text(str(path), path.stat().st_mtime_ns)
+    except OSError:
+        return None
+
+
+@functools.lru_cache(maxsize=8)
+def parse_env_text(text: str) -> dict[str, str]:
+    """Parse .env file contents into a dict (cached per contents)."""
+    env = {}
+    for match in _ENV_LINE_RE.finditer(text):
+        key, double_quoted, single_quoted, unquoted = match.groups()
+        if double_quoted is not None:
+            value = _ENV_DOUBLE_ESCAPE_RE.sub(lambda m: _ENV_ESCAPES[m[1]], double_quoted)
+        elif single_quoted is not None:
+            value = _ENV_SINGLE_ESCAPE_RE.sub(r"\1", single_quoted)
+        elif unquoted.startswith(("'", '"')):
+            continue  # Unterminated quote
+        else:
+            value = _ENV_COMMENT_RE.sub("", unquoted).strip()
+        env[key] = value
+    return env
+
+
+def _toml_stamp(stat: os.stat_result) -> list[int]:
+    """Identify a version of config.toml by its mtime (ns) and size."""
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _read_config_file(stamp: list[int]) -> dict[str, Any]:
+    """Read config, preferring the JSON cache if it was made from this TOML.
+
+    The cache records the stamp of the TOML it was written with, so a TOML
+    restored with an older mtime (backup, rsync -t, dotfile checkout) is
+    never shadowed by a stale cache.
+    """
+    try:
+        cached = json.loads(CONFIG_CACHE_FILE.read_bytes())
+        if cached.get("toml") == stamp:
+            return cached["config"]
+    except (OSError, ValueError, AttributeError, KeyError):
+        pass
+
+    # Use tomllib (3.11+) or tomli for TOML reading
+    if sys.version_info >= (3, 11):
+        import tomllib
+    else:
+        import tomli as tomllib
+
+    with open(CONFIG_FILE, "rb") as f:
+        return tomllib.load(f)
+
 
 def get_config() -> dict[str, Any]:
     """Load config from TOML file, returning defaults if not found."""
-    if not CONFIG_FILE.exists():
+    global _config_cache
+
+    try:
+        stamp = _toml_stamp(CONFIG_FILE.stat())
+    except OSError:
         return {"defaults": {"provider": DEFAULT_PROVIDER, "model": DEFAULT_MODEL}}
 
+    if _config_cache is not None and _config_cache[0] == stamp:
+        return _config_cache[1]
+
     try:
-        with open(CONFIG_FILE, "rb") as f:
-            config = tomllib.load(f)
+        config = _read_config_file(stamp)
         # Ensure defaults section exists
         if "defaults" not in config:
             config["defaults"] = {}
         # Fill in missing defaults
         config["defaults"].setdefault("provider", DEFAULT_PROVIDER)
         config["defaults"].setdefault("model", DEFAULT_MODEL)
+        _config_cache = (stamp, config)
         return config
     except Exception:
         return {"defaults": {"provider": DEFAULT_PROVIDER, "model": DEFAULT_MODEL}}
@@ -53,17 +167,25 @@ def get_config() -> dict[str, Any]:
 
 def save_config(config: dict[str, Any]) -> None:
     """Save config to TOML file."""
+    global _config_cache
+    _config_cache = None
     CONFIG_DIR.mkdir(parents=True, exist_ok=True)
 
     # Simple TOML writing (avoiding extra dependency for simple config)
     lines = ["[defaults]"]
     defaults = config.get("defaults", {})
+    saved: dict[str, Any] = {"defaults": {}}
     if "provider" in defaults:
         lines.append(f'provider = "{defaults["provider"]}"')
+        saved["defaults"]["provider"] = defaults["provider"]
     if "model" in defaults:
         lines.append(f'model = "{defaults["model"]}"')
+        saved["defaults"]["model"] = defaults["model"]
 
     CONFIG_FILE.write_text("\n".join(lines) + "\n")
+    # Tagged with the TOML it mirrors; any other TOML version ignores it
+    stamp = _toml_stamp(CONFIG_FILE.stat())
+    CONFIG_CACHE_FILE.write_text(json.dumps({"toml": stamp, "config": saved}))
 
 
 def get_default_provider() -> str:
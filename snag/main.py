@@ -1,6 +1,7 @@
 """CLI entry point for Snag."""
 
 import argparse
+import functools
 import os
 import subprocess
 import sys
@@ -12,10 +13,12 @@ from .config import (
     DEFAULT_MODEL,
     DEFAULT_PROVIDER,
     ENV_FILE,
+    ENV_LOCATIONS,
     GOOGLE_MODELS,
     get_config,
-    get_default_model,
     get_default_provider,
+    parse_env_text,
+    read_env_text,
     save_config,
     set_default_model,
     set_default_provider,
@@ -27,38 +30,57 @@ GIT_REPO = "git+https://github.com/am-will/snag.git"
 # Package root directory (for finding CHANGELOG.md)
 PACKAGE_ROOT = Path(__file__).parent.parent
 
-# Standard config locations for .env file
-ENV_LOCATIONS = [
-    CONFIG_DIR / ".env",
-    Path.home() / ".snag.env",
-    Path.cwd() / ".env",
-]
+
+# Environment variable holding each provider's API key
+API_KEY_NAMES = {
+    "google": "GEMINI_API_KEY",
+    "openrouter": "OPENROUTER_API_KEY",
+    "zai": "Z_AI_API_KEY",
+}
+
+# Where to get each provider's API key
+API_KEY_URLS = {
+    "google": "https://aistudio.google.com/apikey",
+    "openrouter": "https://openrouter.ai/keys",
+    "zai": "https://open.bigmodel.cn/",
+}
+
+
+def _api_key_name(provider: str) -> str:
+    """Get the environment variable name holding a provider's API key."""
+    return API_KEY_NAMES.get(provider) or f"{provider.upper()}_API_KEY"
 
 
 def has_api_key(provider: str = "google") -> bool:
     """Check if API key for provider is available (env or .env)."""
-    key_map = {
-        "google": "GEMINI_API_KEY",
-        "openrouter": "OPENROUTER_API_KEY",
-        "zai": "Z_AI_API_KEY",
-    }
-    key_name = key_map.get(provider, f"{provider.upper()}_API_KEY")
+    key_name = _api_key_name(provider)
 
     # Check env var first
     if os.environ.get(key_name):
         return True
     # Check .env files in standard locations
     for env_file in ENV_LOCATIONS:
-        if env_file.exists():
-            content = env_file.read_text()
-            for line in content.splitlines():
-                if line.strip().startswith(f"{key_name}="):
-                    value = line.split("=", 1)[1].strip().strip('"').strip("'")
-                    if value:
-                        return True
+        text = read_env_text(env_file)
+        if text is not None and parse_env_text(text).get(key_name):
+            return True
     return False
 
 
+def _env_status() -> dict[str, bool]:
+    """Check all providers' API keys with a single pass over the .env files."""
+    configured: set[str] = set()
+    for env_file in ENV_LOCATIONS:
+        text = read_env_text(env_file)
+        if text is None:
+            continue
+        parsed = parse_env_text(text)
+        configured.update(key for key, value in parsed.items() if value)
+    return {
+        provider: bool(os.environ.get(key_name)) or key_name in configured
+        for provider, key_name in API_KEY_NAMES.items()
+    }
+
+
 def run_update() -> int:
     """Update snag to the latest version using uv."""
     print("Updating snag...")
@@ -115,33 +137,41 @@ def show_changelog(latest_only: bool = True) -> int:
     return 0
 
 
-def get_logo() -> str:
-    """Generate colored ASCII art logo."""
-    # ANSI color codes for gradient effect (blue -> cyan -> green)
-    c1 = "\033[38;5;33m"   # Blue
-    c2 = "\033[38;5;39m"   # Light blue
-    c3 = "\033[38;5;44m"   # Cyan
-    c4 = "\033[38;5;49m"   # Cyan-green
-    c5 = "\033[38;5;83m"   # Green
-    r = "\033[0m"          # Reset
-
-    return f"""
-{c1}  ███████╗{c2}███╗   ██╗{c3} █████╗ {c4} ██████╗ {r}
-{c1}  ██╔════╝{c2}████╗  ██║{c3}██╔══██╗{c4}██╔════╝ {r}
-{c1}  ███████╗{c2}██╔██╗ ██║{c3}███████║{c4}██║  ███╗{r}
-{c1}  ╚════██║{c2}██║╚██╗██║{c3}██╔══██║{c4}██║   ██║{r}
-{c1}  ███████║{c2}██║ ╚████║{c3}██║  ██║{c4}╚██████╔╝{r}
-{c1}  ╚══════╝{c2}╚═╝  ╚═══╝{c3}╚═╝  ╚═╝{c4} ╚═════╝ {r}
-
-{c3}  Screenshot → Text → Clipboard{r}
+# ANSI color codes for gradient effect (blue -> cyan -> green)
+_C1 = "\033[38;5;33m"   # Blue
+_C2 = "\033[38;5;39m"   # Light blue
+_C3 = "\033[38;5;44m"   # Cyan
+_C4 = "\033[38;5;49m"   # Cyan-green
+_R = "\033[0m"          # Reset
+
+# Colored ASCII art logo, built once at import
+_LOGO = f"""
+{_C1}  ███████╗{_C2}███╗   ██╗{_C3} █████╗ {_C4} ██████╗ {_R}
+{_C1}  ██╔════╝{_C2}████╗  ██║{_C3}██╔══██╗{_C4}██╔════╝ {_R}
+{_C1}  ███████╗{_C2}██╔██╗ ██║{_C3}███████║{_C4}██║  ███╗{_R}
+{_C1}  ╚════██║{_C2}██║╚██╗██║{_C3}██╔══██║{_C4}██║   ██║{_R}
+{_C1}  ███████║{_C2}██║ ╚████║{_C3}██║  ██║{_C4}╚██████╔╝{_R}
+{_C1}  ╚══════╝{_C2}╚═╝  ╚═══╝{_C3}╚═╝  ╚═╝{_C4} ╚═════╝ {_R}
+
+{_C3}  Screenshot → Text → Clipboard{_R}
 """
 
 
+def get_logo() -> str:
+    """Return the colored ASCII art logo."""
+    return _LOGO
+
+
+@functools.cache
 def ensure_config_exists() -> Path:
-    """Ensure config directory and .env file exist with placeholder."""
-    CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-    env_file = CONFIG_DIR / ".env"
+    """Ensure config directory and .env file exist with placeholder.
+
+    Only the first call per process touches the filesystem, and once the
+    .env file exists that is a single stat (no mkdir).
+    """
+    env_file = ENV_FILE
     if not env_file.exists():
+        CONFIG_DIR.mkdir(parents=True, exist_ok=True)
         env_file.write_text(
             '# API Keys for Snag\n'
             '# Google Gemini: https://aistudio.google.com/apikey\n'
@@ -156,43 +186,48 @@ def ensure_config_exists() -> Path:
 
 def _get_env_content() -> dict[str, str]:
     """Read current .env file content as dict."""
-    env_file = CONFIG_DIR / ".env"
-    content = {}
-    if env_file.exists():
-        for line in env_file.read_text().splitlines():
-            line = line.strip()
-            if line and not line.startswith("#") and "=" in line:
-                key, value = line.split("=", 1)
-                content[key.strip()] = value.strip().strip('"').strip("'")
-    return content
+    text = read_env_text(ENV_FILE)
+    if text is None:
+        return {}
+    # Copy: the parse is cached and callers edit the returned dict
+    return dict(parse_env_text(text))
 
 
 def _save_env_content(content: dict[str, str]) -> None:
     """Save dict to .env file."""
     env_file = CONFIG_DIR / ".env"
+    google = API_KEY_NAMES["google"]
+    openrouter = API_KEY_NAMES["openrouter"]
+    zai = API_KEY_NAMES["zai"]
     lines = [
         "# API Keys for Snag",
         "# Google Gemini: https://aistudio.google.com/apikey",
-        f'GEMINI_API_KEY="{content.get("GEMINI_API_KEY", "")}"',
+        f'{google}="{content.get(google, "")}"',
         "# OpenRouter: https://openrouter.ai/keys",
-        f'OPENROUTER_API_KEY="{content.get("OPENROUTER_API_KEY", "")}"',
+        f'{openrouter}="{content.get(openrouter, "")}"',
         "# Z.AI (GLM-4.6V): https://open.bigmodel.cn/",
-        f'Z_AI_API_KEY="{content.get("Z_AI_API_KEY", "")}"',
+        f'{zai}="{content.get(zai, "")}"',
     ]
-    env_file.write_text("\n".join(lines) + "\n")
-
-
-def _configure_api_key(provider: str) -> bool:
-    """Configure API key for a provider. Returns True if successful."""
+    # Write to a temp file and swap it in so the .env is never left half-written.
+    # The file holds secrets: keep its current mode, or 0600 for a new file.
+    try:
+        mode = env_file.stat().st_mode & 0o777
+    except OSError:
+        mode = 0o600
+    tmp_file = env_file.with_name(env_file.name + ".tmp")
+    fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+    with os.fdopen(fd, "w") as f:
+        os.chmod(tmp_file, mode)  # os.open's mode is masked by the umask
+        f.write("\n".join(lines) + "\n")
+    os.replace(tmp_file, env_file)
+
+
+def _configure_api_key(provider: str, env_content: dict[str, str]) -> bool:
+    """Configure API key for a provider in env_content. Returns True if successful."""
     import getpass
 
-    env_content = _get_env_content()
-    key_map = {
-        "google": ("GEMINI_API_KEY", "https://aistudio.google.com/apikey"),
-        "openrouter": ("OPENROUTER_API_KEY", "https://openrouter.ai/keys"),
-        "zai": ("Z_AI_API_KEY", "https://open.bigmodel.cn/"),
-    }
-    key_name, url = key_map.get(provider, (f"{provider.upper()}_API_KEY", ""))
+    key_name = _api_key_name(provider)
+    url = API_KEY_URLS.get(provider, "")
 
     print(f"\nGet your API key at: {url}\n")
 
@@ -212,33 +247,36 @@ def _configure_api_key(provider: str) -> bool:
     return True
 
 
-def _show_current_settings() -> None:
-    """Display current configuration."""
+def _show_current_settings(env_content: dict[str, str]) -> None:
+    """Display current configuration, including keys set in env_content."""
     config = get_config()
     defaults = config.get("defaults", {})
 
-    print("\n" + "=" * 50)
-    print("  Current Settings")
-    print("=" * 50)
-
     # API Keys status
-    gemini_ok = has_api_key("google")
-    openrouter_ok = has_api_key("openrouter")
-    zai_ok = has_api_key("zai")
-    print(f"\n  API Keys:")
-    print(f"    Google Gemini:  {'configured' if gemini_ok else 'not configured'}")
-    print(f"    OpenRouter:     {'configured' if openrouter_ok else 'not configured'}")
-    print(f"    Z.AI:           {'configured' if zai_ok else 'not configured'}")
-
-    # Defaults
-    print(f"\n  Defaults:")
-    print(f"    Provider: {defaults.get('provider', DEFAULT_PROVIDER)}")
-    print(f"    Model:    {defaults.get('model', DEFAULT_MODEL)}")
-
-    print(f"\n  Config files:")
-    print(f"    {CONFIG_DIR / '.env'}")
-    print(f"    {CONFIG_DIR / 'config.toml'}")
-    print()
+    status = _env_status()
+
+    def key_status(provider: str) -> str:
+        if status[provider] or env_content.get(API_KEY_NAMES[provider]):
+            return "configured"
+        return "not configured"
+
+    # Written in one go rather than a print() per line
+    sys.stdout.write(
+        f"\n{'=' * 50}\n"
+        "  Current Settings\n"
+        f"{'=' * 50}\n"
+        "\n  API Keys:\n"
+        f"    Google Gemini:  {key_status('google')}\n"
+        f"    OpenRouter:     {key_status('openrouter')}\n"
+        f"    Z.AI:           {key_status('zai')}\n"
+        "\n  Defaults:\n"
+        f"    Provider: {defaults.get('provider', DEFAULT_PROVIDER)}\n"
+        f"    Model:    {defaults.get('model', DEFAULT_MODEL)}\n"
+        "\n  Config files:\n"
+        f"    {CONFIG_DIR / '.env'}\n"
+        f"    {CONFIG_DIR / 'config.toml'}\n"
+        "\n"
+    )
 
 
 def run_setup() -> int:
@@ -247,19 +285,30 @@ def run_setup() -> int:
 
     print(get_logo())
 
+    # The .env is read once; each configured key is written straight back
+    return _run_setup_menu(_get_env_content())
+
+
+_SETUP_MENU = (
+    f"{'=' * 50}\n"
+    "  Setup Menu\n"
+    f"{'=' * 50}\n"
+    "\n  1. Configure Google Gemini API key\n"
+    "  2. Configure OpenRouter API key\n"
+    "  3. Configure Z.AI API key\n"
+    "  4. Set default provider\n"
+    "  5. Set default model\n"
+    "  6. Exit setup\n"
+    "\n"
+)
+
+
+def _run_setup_menu(env_content: dict[str, str]) -> int:
+    """Run the interactive setup menu loop."""
     while True:
-        _show_current_settings()
-
-        print("=" * 50)
-        print("  Setup Menu")
-        print("=" * 50)
-        print("\n  1. Configure Google Gemini API key")
-        print("  2. Configure OpenRouter API key")
-        print("  3. Configure Z.AI API key")
-        print("  4. Set default provider")
-        print("  5. Set default model")
-        print("  6. Exit setup")
-        print()
+        _show_current_settings(env_content)
+
+        sys.stdout.write(_SETUP_MENU)
 
         try:
             choice = input("Select option [1-6]: ").strip()
@@ -268,19 +317,21 @@ def run_setup() -> int:
             return 0
 
         if choice == "1":
-            _configure_api_key("google")
+            _configure_api_key("google", env_content)
 
         elif choice == "2":
-            _configure_api_key("openrouter")
+            _configure_api_key("openrouter", env_content)
 
         elif choice == "3":
-            _configure_api_key("zai")
+            _configure_api_key("zai", env_content)
 
         elif choice == "4":
-            print("\n  Available providers:")
-            print("    1. google (Google Gemini)")
-            print("    2. openrouter (OpenRouter)")
-            print("    3. zai (Z.AI GLM-4.6V)")
+            sys.stdout.write(
+                "\n  Available providers:\n"
+                "    1. google (Google Gemini)\n"
+                "    2. openrouter (OpenRouter)\n"
+                "    3. zai (Z.AI GLM-4.6V)\n"
+            )
             try:
                 p_choice = input("\n  Select provider [1-3]: ").strip()
             except (KeyboardInterrupt, EOFError):
@@ -355,16 +406,38 @@ def run_setup() -> int:
             print("\nInvalid option. Please enter 1-6.")
 
 
+def _report_error(notification: str, message: str) -> int:
+    """Show an error notification and print message to stderr. Returns 1."""
+    from .notify import notify_error
+
+    notify_error(notification)
+    print(message, file=sys.stderr)
+    return 1
+
+
+class _ConfigHelpParser(argparse.ArgumentParser):
+    """Argument parser that fills in config defaults only when help is shown.
+
+    Keeps --version, --update and --changelog from reading the config file.
+    """
+
+    def format_help(self) -> str:
+        defaults = get_config()["defaults"]
+        fields = {"provider": defaults["provider"], "model": defaults["model"]}
+        for action in self._actions:
+            if action.help:
+                action.help = action.help.format(**fields)
+        if self.epilog:
+            self.epilog = self.epilog.format(**fields)
+        return super().format_help()
+
+
 def main() -> int:
     """Main entry point for the Snag CLI."""
-    # Get defaults from config
-    config_provider = get_default_provider()
-    config_model = get_default_model()
-
-    parser = argparse.ArgumentParser(
+    parser = _ConfigHelpParser(
         description="Screenshot to text using vision AI",
         formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog=f"""
+        epilog="""
 Examples:
   snag                                          # Use defaults from config
   snag --provider google --model gemini-2.5-flash
@@ -373,8 +446,8 @@ Examples:
   snag --setup                                  # Configure API keys and defaults
 
 Current defaults (from config):
-  Provider: {config_provider}
-  Model:    {config_model}
+  Provider: {provider}
+  Model:    {model}
 
 Environment:
   GEMINI_API_KEY       Google Gemini API key (https://aistudio.google.com/apikey)
@@ -387,14 +460,21 @@ Environment:
         "--provider",
         choices=["google", "openrouter", "zai"],
         default=None,
-        help=f"Vision provider to use (default: {config_provider})",
+        help="Vision provider to use (default: {provider})",
     )
 
     parser.add_argument(
         "--model",
         type=str,
         default=None,
-        help=f"Model to use (default: {config_model})",
+        help="Model to use (default: {model})",
+    )
+
+    parser.add_argument(
+        "--backend",
+        choices=["tk", "qt"],
+        default="tk",
+        help="Selection overlay on X11/Windows; qt requires PySide6 (default: tk)",
     )
 
     parser.add_argument(
@@ -439,39 +519,50 @@ Environment:
     if args.changelog_full:
         return show_changelog(latest_only=False)
 
-    # Ensure config file exists (creates placeholder on first run)
-    ensure_config_exists()
-
     # Run setup if requested
     if args.setup:
         return run_setup()
 
-    # Determine provider and model to use
-    provider = args.provider or config_provider
-    model = args.model or config_model
-
-    # Check if API key is configured for the chosen provider
-    if not has_api_key(provider):
-        key_map = {
-            "google": "GEMINI_API_KEY",
-            "openrouter": "OPENROUTER_API_KEY",
-            "zai": "Z_AI_API_KEY",
-        }
-        key_name = key_map.get(provider, f"{provider.upper()}_API_KEY")
-        print(f"Error: {key_name} not found for provider '{provider}'.", file=sys.stderr)
-        print(f"Run 'snag --setup' to configure your API key.", file=sys.stderr)
-        return 1
+    # Determine provider and model to use (config only read when needed)
+    if args.provider and args.model:
+        provider, model = args.provider, args.model
+    else:
+        defaults = get_config()["defaults"]
+        provider = args.provider or defaults["provider"]
+        model = args.model or defaults["model"]
+
+    # An exported key skips the config dir and .env scan
+    key_name = _api_key_name(provider)
+    if not os.environ.get(key_name):
+        ensure_config_exists()
+        if not has_api_key(provider):
+            print(f"Error: {key_name} not found for provider '{provider}'.", file=sys.stderr)
+            print(f"Run 'snag --setup' to configure your API key.", file=sys.stderr)
+            return 1
 
     # Import heavy dependencies only when needed for capture
     from .capture import CaptureError, SelectionCancelled, capture_region
-    from .clipboard import copy_to_clipboard
-    from .notify import notify_error, notify_processing, notify_success
-    from .vision import VisionError, describe_image
 
     try:
         # 1. Capture screenshot region
-        image = capture_region()
+        image = capture_region(backend=args.backend)
+
+    except SelectionCancelled:
+        # User cancelled - exit silently
+        return 0
 
+    except CaptureError as e:
+        return _report_error(str(e), f"Capture error: {e}")
+
+    except Exception as e:
+        return _report_error(f"Unexpected error: {e}", f"Error: {e}")
+
+    # Imported after capture so the selection overlay doesn't wait on them
+    from .clipboard import copy_to_clipboard
+    from .notify import notify_processing, notify_success
+    from .vision import VisionError, describe_image
+
+    try:
         # 2. Send to vision API for description (notify while waiting)
         notify_processing()
         result = describe_image(image, model=model, provider=provider)
@@ -484,24 +575,11 @@ Environment:
 
         return 0
 
-    except SelectionCancelled:
-        # User cancelled - exit silently
-        return 0
-
-    except CaptureError as e:
-        notify_error(str(e))
-        print(f"Capture error: {e}", file=sys.stderr)
-        return 1
-
     except VisionError as e:
-        notify_error(str(e))
-        print(f"Vision error: {e}", file=sys.stderr)
-        return 1
+        return _report_error(str(e), f"Vision error: {e}")
 
     except Exception as e:
-        notify_error(f"Unexpected error: {e}")
-        print(f"Error: {e}", file=sys.stderr)
-        return 1
+        return _report_error(f"Unexpected error: {e}", f"Error: {e}")
 
 
 if __name__ == "__main__":
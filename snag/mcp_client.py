@@ -2,9 +2,12 @@
 
 import json
 import os
+import queue
+import selectors
 import subprocess
 import sys
 import threading
+import time
 from typing import Any, Optional
 
 
@@ -32,6 +35,13 @@ class MCPClient:
         self.timeout = timeout
         self._process: Optional[subprocess.Popen] = None
         self._request_id = 0
+        # POSIX: poll stdout directly and split lines out of a byte buffer
+        self._selector: Optional[selectors.BaseSelector] = None
+        self._buffer = bytearray()
+        # Windows (no select() on pipes): messages (or read errors) from a
+        # background reader thread
+        self._inbox: "queue.Queue[tuple[dict, Optional[str]]]" = queue.Queue()
+        self._reader: Optional[threading.Thread] = None
 
     def _next_id(self) -> int:
         """Get next request ID."""
@@ -42,40 +52,71 @@ class MCPClient:
         """Send JSON message to MCP server."""
         if not self._process or not self._process.stdin:
             raise MCPError("MCP server not connected")
-        line = json.dumps(message) + "\n"
+        # Compact separators: no padding whitespace on the wire
+        line = json.dumps(message, separators=(",", ":")).encode() + b"\n"
         self._process.stdin.write(line)
         self._process.stdin.flush()
 
+    @staticmethod
+    def _parse_line(line: bytes) -> tuple[dict, Optional[str]]:
+        """Parse one line from the server into (message, error)."""
+        try:
+            # json.loads takes the raw bytes, no decode/strip copies
+            return json.loads(line), None
+        except ValueError as e:  # JSONDecodeError or UnicodeDecodeError
+            return {}, f"Invalid JSON from MCP server: {e}"
+
+    def _reader_loop(self, stdout, inbox: queue.Queue) -> None:
+        """Read JSON messages from the server and queue them for _recv()."""
+        while True:
+            try:
+                line = stdout.readline()
+            except Exception as e:
+                inbox.put(({}, f"Read error: {e}"))
+                return
+            if not line:
+                inbox.put(({}, "MCP server closed connection"))
+                return
+            inbox.put(self._parse_line(line))
+
+    def _read_selected(self, fd: int) -> Optional[tuple[dict, Optional[str]]]:
+        """Read the next message by polling stdout; None on timeout."""
+        deadline = time.monotonic() + self.timeout
+        while True:
+            line, newline, rest = self._buffer.partition(b"\n")
+            if newline:
+                self._buffer = rest
+                return self._parse_line(line)
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not self._selector.select(remaining):
+                return None
+            try:
+                chunk = os.read(fd, 65536)
+            except OSError as e:
+                return {}, f"Read error: {e}"
+            if not chunk:
+                return {}, "MCP server closed connection"
+            self._buffer += chunk
+
     def _recv(self) -> dict:
         """Receive JSON message from MCP server with timeout."""
         if not self._process or not self._process.stdout:
             raise MCPError("MCP server not connected")
 
-        result: dict = {}
-        error: Optional[str] = None
-
-        def read_line():
-            nonlocal result, error
+        if self._selector is not None:
+            message = self._read_selected(self._process.stdout.fileno())
+        else:
             try:
-                line = self._process.stdout.readline()
-                if not line:
-                    error = "MCP server closed connection"
-                    return
-                result = json.loads(line.strip())
-            except json.JSONDecodeError as e:
-                error = f"Invalid JSON from MCP server: {e}"
-            except Exception as e:
-                error = f"Read error: {e}"
-
-        # Use threading for timeout (works on all platforms)
-        thread = threading.Thread(target=read_line)
-        thread.start()
-        thread.join(timeout=self.timeout)
+                message = self._inbox.get(timeout=self.timeout)
+            except queue.Empty:
+                message = None
 
-        if thread.is_alive():
+        if message is None:
             # Timeout - kill process
             self._kill_process()
             raise MCPError(f"MCP server did not respond within {self.timeout}s")
+        result, error = message
 
         if error:
             raise MCPError(error)
@@ -84,16 +125,22 @@ class MCPClient:
 
     def _send_request(self, method: str, params: Optional[dict] = None) -> dict:
         """Send JSON-RPC request and wait for response."""
+        request_id = self._next_id()
         request: dict[str, Any] = {
             "jsonrpc": "2.0",
             "method": method,
-            "id": self._next_id(),
+            "id": request_id,
         }
         if params:
             request["params"] = params
 
         self._send(request)
-        response = self._recv()
+        # Skip server notifications/requests and leftover responses to earlier
+        # requests, so a reused connection never pairs the wrong reply
+        while True:
+            response = self._recv()
+            if "method" not in response and response.get("id") == request_id:
+                break
 
         if "error" in response:
             error = response["error"]
@@ -125,6 +172,14 @@ class MCPClient:
                 except Exception:
                     pass
             self._process = None
+        if self._selector is not None:
+            self._selector.close()
+            self._selector = None
+
+    @property
+    def is_connected(self) -> bool:
+        """Whether the server process is running."""
+        return self._process is not None and self._process.poll() is None
 
     def connect(self) -> None:
         """Start MCP server process and perform initialization handshake."""
@@ -137,16 +192,31 @@ class MCPClient:
                 self.command,
                 stdin=subprocess.PIPE,
                 stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,  # never read; a full pipe would stall the server
                 env=full_env,
-                text=True,
-                bufsize=1,  # Line buffered
             )
         except FileNotFoundError as e:
             raise MCPError(f"Failed to start MCP server: {e}")
         except Exception as e:
             raise MCPError(f"Failed to start MCP server: {e}")
 
+        if sys.platform != "win32":
+            # Wait on the pipe itself: no thread, no queue hand-off. stdout
+            # is only ever read through os.read(), never its buffered reader.
+            self._buffer = bytearray()
+            self._selector = selectors.DefaultSelector()
+            self._selector.register(self._process.stdout, selectors.EVENT_READ)
+        else:
+            # select() only works on sockets on Windows, so use one reader
+            # thread for the life of the connection
+            self._inbox = queue.Queue()
+            self._reader = threading.Thread(
+                target=self._reader_loop,
+                args=(self._process.stdout, self._inbox),
+                daemon=True,
+            )
+            self._reader.start()
+
         # Perform initialization handshake
         try:
             self._send_request("initialize", {
@@ -184,11 +254,16 @@ class MCPClient:
         # Extract text from content array
         content = result.get("content", [])
         if isinstance(content, list):
-            texts = []
-            for item in content:
+            # Common case: a single text block, returned as-is
+            if len(content) == 1:
+                item = content[0]
                 if isinstance(item, dict) and item.get("type") == "text":
-                    texts.append(item.get("text", ""))
-            return "\n".join(texts)
+                    return item.get("text", "")
+            return "\n".join(
+                item.get("text", "")
+                for item in content
+                if isinstance(item, dict) and item.get("type") == "text"
+            )
         elif isinstance(content, str):
             return content
 
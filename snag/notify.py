@@ -4,16 +4,27 @@ import subprocess
 import sys
 import warnings
 
+# AppleScript string escaping, applied in one pass with str.translate
+_APPLESCRIPT_ESCAPES = str.maketrans({'"': '\\"', "\\": "\\\\"})
+_OSASCRIPT_CMD = ("osascript", "-e")
 
-def _notify_macos(title: str, message: str) -> bool:
-    """Show notification on macOS using osascript."""
+# plyer's dbus backend warns when dbus-python is missing; the filter is
+# static, so install it once instead of per notification
+warnings.filterwarnings("ignore", message=".*dbus.*")
+
+# plyer's notification facade, imported on first use (it probes backends)
+_plyer_notification = None
+
+
+def _notify_macos(title: str, message: str, timeout: int) -> bool:
+    """Show notification on macOS using osascript (timeout is up to the OS)."""
     try:
-        # Escape quotes for AppleScript
-        title = title.replace('"', '\\"')
-        message = message.replace('"', '\\"')
-        script = f'display notification "{message}" with title "{title}"'
+        script = (
+            f'display notification "{message.translate(_APPLESCRIPT_ESCAPES)}"'
+            f' with title "{title.translate(_APPLESCRIPT_ESCAPES)}"'
+        )
         subprocess.run(
-            ["osascript", "-e", script],
+            [*_OSASCRIPT_CMD, script],
             capture_output=True,
             timeout=5,
         )
@@ -24,21 +35,25 @@ def _notify_macos(title: str, message: str) -> bool:
 
 def _notify_plyer(title: str, message: str, timeout: int) -> bool:
     """Show notification using plyer (Linux/Windows)."""
+    global _plyer_notification
     try:
-        with warnings.catch_warnings():
-            warnings.filterwarnings("ignore", message=".*dbus.*")
-            from plyer import notification
-            notification.notify(
-                title=title,
-                message=message[:256],
-                app_name="Snag",
-                timeout=timeout,
-            )
+        if _plyer_notification is None:
+            from plyer import notification as _plyer_notification
+        _plyer_notification.notify(
+            title=title,
+            message=message[:256],
+            app_name="Snag",
+            timeout=timeout,
+        )
         return True
     except Exception:
         return False
 
 
+# Platform backend, chosen once at import
+_notify_impl = _notify_macos if sys.platform == "darwin" else _notify_plyer
+
+
 def notify(title: str, message: str, timeout: int = 5) -> None:
     """Show a desktop notification.
 
@@ -47,10 +62,7 @@ def notify(title: str, message: str, timeout: int = 5) -> None:
         message: Notification body text
         timeout: How long to show (seconds)
     """
-    if sys.platform == "darwin":
-        _notify_macos(title, message)
-    else:
-        _notify_plyer(title, message, timeout)
+    _notify_impl(title, message, timeout)
 
 
 def notify_processing() -> None:
@@ -61,9 +73,8 @@ def notify_processing() -> None:
 def notify_success(preview: str) -> None:
     """Show a success notification with text preview."""
     # Show first 100 chars as preview
-    if len(preview) > 100:
-        preview = preview[:100] + "..."
-    notify("Snag", f"Copied to clipboard:\n{preview}")
+    ellipsis = "..." if len(preview) > 100 else ""
+    notify("Snag", f"Copied to clipboard:\n{preview[:100]}{ellipsis}")
 
 
 def notify_error(error: str) -> None:
@@ -1,5 +1,6 @@
 """Platform detection for Click."""
 
+import functools
 import os
 import sys
 from enum import Enum
@@ -15,8 +16,13 @@ class Platform(Enum):
     UNKNOWN = "unknown"
 
 
+@functools.cache
 def detect_platform() -> Platform:
-    """Detect the current platform and display server."""
+    """Detect the current platform and display server.
+
+    The result is cached for the life of the process; call
+    ``detect_platform.cache_clear()`` to re-detect.
+    """
     if sys.platform == "win32":
         return Platform.WINDOWS
     elif sys.platform == "darwin":
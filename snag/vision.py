@@ -1,33 +1,44 @@
 """Vision API integration for Snag (Google Gemini, OpenRouter, and Z.AI)."""
 
-import base64
+import atexit
+import functools
+import hashlib
+import itertools
+import json
 import os
+import random
 import re
 import subprocess
 import tempfile
+import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from io import BytesIO
 from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Iterator, Optional, Union
 
 import requests
-from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
 from PIL import Image
 
-from .config import DEFAULT_MODEL, DEFAULT_PROVIDER, GOOGLE_MODELS
+try:
+    # SIMD base64 from the optional "fast" extra; same API as the stdlib's
+    from pybase64 import b64encode
+except ImportError:
+    from base64 import b64encode
 
-# Load .env from multiple locations (first found wins, overrides shell env)
-# Priority: ~/.config/snag/.env > ~/.snag.env > ./.env
-_config_dir = Path.home() / ".config" / "snag"
-_env_locations = [
-    _config_dir / ".env",
-    Path.home() / ".snag.env",
-    Path.cwd() / ".env",
-]
+from .config import (
+    CACHE_DIR,
+    DEFAULT_MODEL,
+    DEFAULT_PROVIDER,
+    ENV_LOCATIONS,
+    GOOGLE_MODELS,
+    parse_env_text,
+    read_env_text,
+)
 
-for _env_path in _env_locations:
-    if _env_path.exists():
-        load_dotenv(_env_path, override=True)
-        break
+if TYPE_CHECKING:
+    from .mcp_client import MCPClient
 
 
 class VisionError(Exception):
@@ -42,6 +53,58 @@ OPENROUTER_API_URL = "https://openrouter.ai/api/v1/chat/completions"
 # For backwards compatibility
 MODELS = GOOGLE_MODELS
 
+# Upload format for all providers. The models treat input as lossy
+# anyway; JPEG is as small as WebP on busy screenshots and encodes ~40x
+# faster.
+IMAGE_FORMAT = "JPEG"
+IMAGE_MIME_TYPE = "image/jpeg"
+IMAGE_QUALITY = 85
+
+# An image to describe: a PIL Image, or encoded image bytes (e.g. a PNG or
+# JPEG file's contents)
+ImageInput = Union[Image.Image, bytes]
+
+# Default longest edge sent to the API (override with SNAG_MAX_IMAGE_EDGE).
+# Larger captures are downscaled first: providers shrink them anyway, so
+# the extra pixels only cost encode time, upload bytes and tokens.
+MAX_IMAGE_EDGE = 1568
+
+# Upper bound on a single retry wait, whatever the server asks for
+MAX_BACKOFF = 30.0
+
+# How long disk cache entries stay valid (seconds)
+CACHE_TTL = 24 * 60 * 60
+
+# In-process memo in front of the disk cache (insertion-ordered, oldest
+# entries evicted first)
+_MEMO_SIZE = 128
+_memo: dict[str, str] = {}
+_memo_lock = threading.Lock()
+
+# Per-thread cancel event (attribute "stop") for retry waits. Set by the
+# describe_images*() workers so that Ctrl-C in that call stops them at once
+# instead of sleeping out their backoff; other calls are never affected.
+_retry_scope = threading.local()
+
+# Set when any request is rate limited (429); describe_images_parallel()
+# checks it to cut its concurrency
+_rate_limited = threading.Event()
+
+# Shared HTTP session: keeps TLS connections alive between requests (and
+# across describe_images() workers) instead of a new handshake per call.
+# Retries are handled by the describe functions, not urllib3.
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0))
+
+# Connected Z.AI MCP clients kept between calls, so only the first call
+# pays for the Node.js server start-up
+_MAX_IDLE_ZAI_CLIENTS = 4
+_idle_zai_clients: list = []
+_idle_zai_clients_lock = threading.Lock()
+
+# Stands in for the base64 image data in payload templates
+_IMAGE_SLOT = "@@SNAG_IMAGE@@"
+
 PROMPT = """Analyze this image and provide a comprehensive description in clean markdown format.
 
 If the image contains:
@@ -68,44 +131,68 @@ Output clean markdown that can be directly pasted into a document or LLM convers
 Be thorough but concise. Focus on accurately capturing the content."""
 
 
-def get_gemini_api_key() -> str:
-    """Get Gemini API key from environment or .env file."""
-    key = os.environ.get("GEMINI_API_KEY")
+# Added to PROMPT when several images share one request
+BATCH_INSTRUCTIONS = """The {count} images below are separate screenshots. Apply the instructions above to each image on its own.
+Start the output for each image with a line containing only ===IMAGE N===, where N is the image number (1 to {count}). Output nothing before the first marker."""
+
+_BATCH_MARKER_RE = re.compile(r"^===IMAGE (\d+)===[ \t]*$", re.MULTILINE)
+
+# Major version from `node --version` output (e.g. "v22.1.0")
+_NODE_VERSION_RE = re.compile(r"v(\d+)")
+
+# Images per batched Gemini request, and a cap on their total encoded size
+# (Gemini rejects inline requests over 20 MB)
+GEMINI_BATCH_SIZE = 4
+OPENROUTER_BATCH_SIZE = 4
+_MAX_BATCH_BYTES = 14 * 1024 * 1024  # ~18.7 MB once base64-encoded
+
+
+@functools.cache
+def _load_env() -> None:
+    """Load .env from multiple locations (first found wins, overrides shell env).
+
+    Runs once, the first time an API key is needed. Contents come from the
+    shared read cache, so files main.py already read are not read again.
+    """
+    for env_path in ENV_LOCATIONS:
+        env_text = read_env_text(env_path)
+        if env_text is not None:
+            os.environ.update(parse_env_text(env_text))
+            break
+
+
+@functools.cache
+def _get_api_key(name: str, url: str) -> str:
+    """Get an API key from environment or .env file (cached once found)."""
+    _load_env()
+    key = os.environ.get(name)
     if not key:
         raise VisionError(
-            "GEMINI_API_KEY not found.\n"
-            "Get an API key at: https://aistudio.google.com/apikey\n"
+            f"{name} not found.\n"
+            f"Get an API key at: {url}\n"
             "Run 'snag --setup' to configure."
         )
     return key
 
 
+def get_gemini_api_key() -> str:
+    """Get Gemini API key from environment or .env file."""
+    return _get_api_key("GEMINI_API_KEY", "https://aistudio.google.com/apikey")
+
+
 def get_openrouter_api_key() -> str:
     """Get OpenRouter API key from environment or .env file."""
-    key = os.environ.get("OPENROUTER_API_KEY")
-    if not key:
-        raise VisionError(
-            "OPENROUTER_API_KEY not found.\n"
-            "Get an API key at: https://openrouter.ai/keys\n"
-            "Run 'snag --setup' to configure."
-        )
-    return key
+    return _get_api_key("OPENROUTER_API_KEY", "https://openrouter.ai/keys")
 
 
 def get_zai_api_key() -> str:
     """Get Z.AI API key from environment or .env file."""
-    key = os.environ.get("Z_AI_API_KEY")
-    if not key:
-        raise VisionError(
-            "Z_AI_API_KEY not found.\n"
-            "Get an API key at: https://open.bigmodel.cn/\n"
-            "Run 'snag --setup' to configure."
-        )
-    return key
+    return _get_api_key("Z_AI_API_KEY", "https://open.bigmodel.cn/")
 
 
+@functools.cache
 def _check_node_version() -> tuple[bool, str]:
-    """Check if Node.js >= v22 is available.
+    """Check if Node.js >= v22 is available (checked once per process).
 
     Returns:
         Tuple of (available, message)
@@ -121,7 +208,7 @@ def _check_node_version() -> tuple[bool, str]:
             return False, "Node.js not found in PATH"
 
         version_str = result.stdout.strip()  # e.g., "v22.1.0"
-        match = re.match(r"v(\d+)", version_str)
+        match = _NODE_VERSION_RE.match(version_str)
         if match:
             major = int(match.group(1))
             if major >= 22:
@@ -139,22 +226,314 @@ def _check_node_version() -> tuple[bool, str]:
 get_api_key = get_gemini_api_key
 
 
-def image_to_base64(image: Image.Image) -> str:
-    """Convert PIL Image to base64 string."""
+def _max_image_edge() -> int:
+    """Longest image edge to send: SNAG_MAX_IMAGE_EDGE, else MAX_IMAGE_EDGE."""
+    try:
+        return max(int(os.environ["SNAG_MAX_IMAGE_EDGE"]), 1)
+    except (KeyError, ValueError):
+        return MAX_IMAGE_EDGE
+
+
+def _prepare_for_vision(image: Image.Image) -> Image.Image:
+    """Downscale an image (as a copy) so its longest edge fits the budget."""
+    max_edge = _max_image_edge()
+    if max(image.size) > max_edge:
+        image = image.copy()
+        image.thumbnail((max_edge, max_edge), Image.Resampling.LANCZOS)
+    return image
+
+
+def _encode_image(image: ImageInput) -> bytes:
+    """Encode an image for upload, downscaled by _prepare_for_vision().
+
+    Encoded JPEG bytes that already fit the size budget are sent as-is;
+    other bytes are decoded and re-encoded.
+    """
+    if isinstance(image, (bytes, bytearray)):
+        data = bytes(image)
+        try:
+            # Image.open only reads the header until the pixels are needed
+            image = Image.open(BytesIO(data))
+            if image.format == IMAGE_FORMAT and max(image.size) <= _max_image_edge():
+                return data
+            image.load()
+        except Image.UnidentifiedImageError:
+            raise VisionError("Could not decode image bytes: unrecognized image format")
+        except (OSError, Image.DecompressionBombError) as e:
+            raise VisionError(f"Could not decode image bytes: {e}")
+    image = _prepare_for_vision(image)
+    if image.mode not in ("RGB", "L"):
+        # JPEG has no alpha or palette modes
+        image = image.convert("RGB")
     buffer = BytesIO()
-    image.save(buffer, format="PNG")
-    return base64.b64encode(buffer.getvalue()).decode("utf-8")
+    image.save(buffer, format=IMAGE_FORMAT, quality=IMAGE_QUALITY)
+    return buffer.getvalue()
+
+
+def image_to_base64(image: ImageInput) -> str:
+    """Convert an image (PIL Image or encoded bytes) to a base64 upload string."""
+    return b64encode(_encode_image(image)).decode("utf-8")
+
+
+def _split_template(payload: dict) -> tuple[bytes, ...]:
+    """Serialize payload to JSON bytes, split around each _IMAGE_SLOT."""
+    return tuple(json.dumps(payload).encode().split(_IMAGE_SLOT.encode()))
+
+
+def _json_body(template: tuple[bytes, ...], *images_b64: bytes) -> bytes:
+    """Build a request body by splicing base64 images into a payload template.
+
+    The multi-megabyte base64 data never goes through json.dumps (or a
+    bytes -> str -> bytes round trip); base64 needs no JSON escaping.
+    """
+    chunks = [template[0]]
+    for image_b64, chunk in zip(images_b64, template[1:]):
+        chunks += (image_b64, chunk)
+    return b"".join(chunks)
+
+
+def _gemini_image_part(version: str) -> dict:
+    """Gemini inline image part: 2.5 uses snake_case, 3.x uses camelCase."""
+    if version == "2.5":
+        return {"inline_data": {"mime_type": IMAGE_MIME_TYPE, "data": _IMAGE_SLOT}}
+    return {"inlineData": {"mimeType": IMAGE_MIME_TYPE, "data": _IMAGE_SLOT}}
+
+
+# Gemini request bodies, serialized once at import
+_GEMINI_25_TEMPLATE = _split_template(
+    {"contents": [{"parts": [{"text": PROMPT}, _gemini_image_part("2.5")]}]}
+)
+_GEMINI_3X_TEMPLATE = _split_template(
+    {"contents": [{"parts": [{"text": PROMPT}, _gemini_image_part("3.x")]}]}
+)
+
+
+@functools.lru_cache(maxsize=16)
+def _gemini_batch_template(version: str, count: int) -> tuple[bytes, ...]:
+    """Gemini request body template for a batch of count images."""
+    parts: list[dict] = [
+        {"text": PROMPT},
+        {"text": BATCH_INSTRUCTIONS.format(count=count)},
+    ]
+    for number in range(1, count + 1):
+        parts += ({"text": f"Image {number}:"}, _gemini_image_part(version))
+    return _split_template({"contents": [{"parts": parts}]})
+
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# OpenRouter headers other than Authorization
+_OPENROUTER_HEADERS = {
+    "Content-Type": "application/json",
+    "HTTP-Referer": "https://github.com/snag-cli/snag",
+    "X-Title": "Snag Screenshot Tool",
+}
+
+
+@functools.lru_cache(maxsize=16)
+def _openrouter_template(model: str, count: int = 1) -> tuple[bytes, ...]:
+    """OpenRouter request body template for a model and image count.
+
+    Serialized once per (model, count).
+    """
+    # OpenRouter uses OpenAI-compatible format with base64 data URLs
+    image_part = {
+        "type": "image_url",
+        "image_url": {
+            "url": f"data:{IMAGE_MIME_TYPE};base64,{_IMAGE_SLOT}"
+        }
+    }
+    content: list[dict] = [{"type": "text", "text": PROMPT}]
+    if count == 1:
+        content.append(image_part)
+    else:
+        content.append({"type": "text", "text": BATCH_INSTRUCTIONS.format(count=count)})
+        for number in range(1, count + 1):
+            content += ({"type": "text", "text": f"Image {number}:"}, image_part)
+    return _split_template({
+        "model": model,
+        "messages": [
+            {
+                "role": "user",
+                "content": content
+            }
+        ]
+    })
+
+
+def _cache_key(image_bytes: bytes, provider: str, model: str, prompt: str) -> str:
+    """Build the response cache key for an encoded image and request."""
+    digest = hashlib.blake2b(image_bytes, digest_size=16)
+    digest.update(f"\0{provider}\0{model}\0{prompt}".encode())
+    return digest.hexdigest()
+
+
+def _cache_get(key: str) -> Optional[str]:
+    """Return a cached description, or None on a miss or if caching is off.
+
+    Checks the in-process memo first, then the disk cache.
+    """
+    if os.environ.get("SNAG_NO_CACHE"):
+        return None
+    text = _memo.get(key)
+    if text is not None:
+        return text
+    cache_file = CACHE_DIR / "vision" / f"{key}.md"
+    try:
+        if time.time() - cache_file.stat().st_mtime > CACHE_TTL:
+            return None
+        text = cache_file.read_text(encoding="utf-8")
+    except OSError:
+        return None
+    _memo_put(key, text)
+    return text
+
+
+def _memo_put(key: str, text: str) -> None:
+    """Add a description to the in-process memo, evicting the oldest entry."""
+    with _memo_lock:
+        _memo[key] = text
+        if len(_memo) > _MEMO_SIZE:
+            del _memo[next(iter(_memo))]
+
+
+def _cache_put(key: str, text: str) -> None:
+    """Store a successful description in the response cache."""
+    if os.environ.get("SNAG_NO_CACHE"):
+        return
+    _memo_put(key, text)
+    cache_file = CACHE_DIR / "vision" / f"{key}.md"
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temp file and swap it in so readers never see a partial entry
+        tmp_file = cache_file.with_name(f"{key}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_file.write_text(text, encoding="utf-8")
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass  # Caching is best-effort
+    _prune_cache()
+
+
+@functools.cache
+def _prune_cache() -> None:
+    """Delete expired disk cache entries (once per process, on first store)."""
+    cutoff = time.time() - CACHE_TTL
+    try:
+        with os.scandir(CACHE_DIR / "vision") as entries:
+            for entry in entries:
+                try:
+                    if entry.stat().st_mtime < cutoff:
+                        os.unlink(entry.path)
+                except OSError:
+                    pass
+    except OSError:
+        pass
+
+
+def _backoff(attempt: int, retry_after: Optional[str] = None) -> float:
+    """Seconds to wait before retrying: Retry-After if given, else jittered 2**attempt.
+
+    The jitter keeps concurrent requests that hit a rate limit together
+    from all retrying at the same instant.
+    """
+    if retry_after:
+        try:
+            return min(float(retry_after), MAX_BACKOFF)
+        except ValueError:
+            pass  # HTTP-date form; fall back to exponential backoff
+    return min(2 ** attempt + random.random(), MAX_BACKOFF)
+
+
+def _wait_before_retry(delay: float) -> None:
+    """Sleep before a retry, giving up early if this thread's call is cancelled."""
+    stop = getattr(_retry_scope, "stop", None)
+    if stop is None:
+        time.sleep(delay)
+    elif stop.wait(delay):
+        raise VisionError("Cancelled")
+
+
+def _run_cancellable(stop: threading.Event, func: Callable, *args):
+    """Call func(*args), cutting its retry waits short once stop is set."""
+    _retry_scope.stop = stop
+    try:
+        return func(*args)
+    finally:
+        _retry_scope.stop = None
+
+
+def _error_message(body: bytes) -> str:
+    """Extract the message from an API error body (JSON or plain text)."""
+    try:
+        return json.loads(body)["error"]["message"]
+    except Exception:
+        # Error bodies are short; don't decode a large unexpected one in full
+        return body[:512].decode("utf-8", errors="replace")
+
+
+def _post_with_retry(
+    url: str, body: bytes, headers: dict[str, str], max_retries: int
+) -> dict:
+    """POST a JSON body, retrying rate limits, server errors and network errors.
+
+    Returns:
+        Parsed JSON of the successful (200) response
+
+    Raises:
+        VisionError: On a non-retryable error, or if all attempts fail
+    """
+    last_error = None
+    for attempt in range(max_retries):
+        retry_after = None
+        try:
+            response = _session.post(url, data=body, headers=headers, timeout=60)
+
+            if response.status_code == 200:
+                # Parse the raw bytes: no intermediate decoded str of the body
+                try:
+                    return json.loads(response.content)
+                except ValueError as e:
+                    # e.g. a captive portal or proxy page; retry like a
+                    # network error
+                    last_error = VisionError(f"Invalid JSON response: {e}")
+
+            elif response.status_code == 429 or response.status_code >= 500:
+                # Rate limited or server trouble, wait and retry
+                retry_after = response.headers.get("Retry-After")
+                if response.status_code == 429:
+                    _rate_limited.set()
+                last_error = VisionError(
+                    "Rate limited (429), retrying..."
+                    if response.status_code == 429
+                    else f"Server error ({response.status_code})"
+                )
+
+            else:
+                raise VisionError(
+                    f"API error ({response.status_code}): {_error_message(response.content)}"
+                )
+
+        except requests.exceptions.Timeout:
+            last_error = VisionError("Request timed out")
+
+        except requests.exceptions.RequestException as e:
+            last_error = VisionError(f"Network error: {e}")
+
+        if attempt < max_retries - 1:
+            _wait_before_retry(_backoff(attempt, retry_after))
+
+    raise last_error or VisionError("Failed after retries")
 
 
 def describe_image_google(
-    image: Image.Image,
+    image: ImageInput,
     model: str = DEFAULT_MODEL,
     max_retries: int = 3,
 ) -> str:
     """Send image to Google Gemini and get description.
 
     Args:
-        image: PIL Image to describe
+        image: PIL Image or encoded image bytes to describe
         model: Model name to use (must be a known Google model)
         max_retries: Number of retry attempts on failure
 
@@ -164,111 +543,212 @@ def describe_image_google(
     Raises:
         VisionError: If API call fails after retries
     """
+    send = _gemini_sender(model)
+
+    # Identical screenshots are answered from the cache
+    image_bytes = _encode_image(image)
+    cache_key = _cache_key(image_bytes, "google", model, PROMPT)
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        return cached
+
+    text = send([image_bytes], max_retries)
+    _cache_put(cache_key, text)
+    return text
+
+
+def _gemini_sender(model: str) -> Callable[[list[bytes], int], str]:
+    """Get the request function for a Google model.
+
+    Raises:
+        VisionError: If the model is unknown or no API key is configured
+    """
     if model not in GOOGLE_MODELS:
         available = ", ".join(GOOGLE_MODELS.keys())
         raise VisionError(f"Unknown Google model '{model}'. Available: {available}")
+    return _build_gemini_sender(model, get_gemini_api_key())
 
-    api_key = get_gemini_api_key()
+
+@functools.lru_cache(maxsize=16)
+def _build_gemini_sender(model: str, api_key: str) -> Callable[[list[bytes], int], str]:
+    """Build a request function with the model's endpoint and templates baked in."""
     model_config = GOOGLE_MODELS[model]
     endpoint = f"{model_config['endpoint']}?key={api_key}"
+    version = model_config["version"]
 
     # Build payload based on model version
-    image_b64 = image_to_base64(image)
-
-    if model_config["version"] == "2.5":
-        payload = {
-            "contents": [
-                {
-                    "parts": [
-                        {"text": PROMPT},
-                        {
-                            "inline_data": {
-                                "mime_type": "image/png",
-                                "data": image_b64,
-                            }
-                        },
-                    ]
-                }
-            ]
-        }
+    if version == "2.5":
+        single_template = _GEMINI_25_TEMPLATE
     else:  # 3.x
-        payload = {
-            "contents": [
-                {
-                    "parts": [
-                        {"text": PROMPT},
-                        {
-                            "inlineData": {
-                                "mimeType": "image/png",
-                                "data": image_b64,
-                            }
-                        },
-                    ]
-                }
-            ]
-        }
+        single_template = _GEMINI_3X_TEMPLATE
 
-    # Retry with exponential backoff
-    last_error = None
-    for attempt in range(max_retries):
+    def send(images_bytes: list[bytes], max_retries: int) -> str:
+        """Send encoded images in one Gemini request and return the response text."""
+        if len(images_bytes) > 1:
+            template = _gemini_batch_template(version, len(images_bytes))
+        else:
+            template = single_template
+        body = _json_body(template, *map(b64encode, images_bytes))
+
+        data = _post_with_retry(endpoint, body, _JSON_HEADERS, max_retries)
         try:
-            response = requests.post(
-                endpoint,
-                json=payload,
-                headers={"Content-Type": "application/json"},
-                timeout=60,
-            )
+            return data["candidates"][0]["content"]["parts"][0]["text"]
+        except (KeyError, IndexError) as e:
+            raise VisionError(f"Unexpected API response format: {e}")
 
-            if response.status_code == 200:
-                data = response.json()
-                try:
-                    return data["candidates"][0]["content"]["parts"][0]["text"]
-                except (KeyError, IndexError) as e:
-                    raise VisionError(f"Unexpected API response format: {e}")
-
-            elif response.status_code == 429:
-                # Rate limited, wait and retry
-                wait_time = 2 ** attempt
-                time.sleep(wait_time)
-                last_error = VisionError("Rate limited (429), retrying...")
-                continue
+    return send
 
-            else:
-                error_msg = response.text
-                try:
-                    error_data = response.json()
-                    if "error" in error_data:
-                        error_msg = error_data["error"].get("message", error_msg)
-                except Exception:
-                    pass
-                raise VisionError(
-                    f"API error ({response.status_code}): {error_msg}"
-                )
 
-        except requests.exceptions.Timeout:
-            last_error = VisionError("Request timed out")
-            wait_time = 2 ** attempt
-            time.sleep(wait_time)
-            continue
+def _split_batch_response(text: str, count: int) -> Optional[list[str]]:
+    """Split a batched response on its ===IMAGE N=== markers.
 
-        except requests.exceptions.RequestException as e:
-            last_error = VisionError(f"Network error: {e}")
-            wait_time = 2 ** attempt
-            time.sleep(wait_time)
-            continue
+    Returns None unless exactly markers 1..count appear, in order.
+    """
+    markers = list(_BATCH_MARKER_RE.finditer(text))
+    if [int(marker[1]) for marker in markers] != list(range(1, count + 1)):
+        return None
+    ends = [marker.start() for marker in markers[1:]] + [len(text)]
+    return [text[marker.end():end].strip() for marker, end in zip(markers, ends)]
 
-    raise last_error or VisionError("Failed after retries")
+
+def describe_images_google_batched(
+    images: list[ImageInput],
+    model: str = DEFAULT_MODEL,
+    max_retries: int = 3,
+    batch_size: int = GEMINI_BATCH_SIZE,
+) -> list[str]:
+    """Send several images to Google Gemini, up to batch_size per request.
+
+    Cached images are skipped. If a batched response cannot be split into
+    one section per image, that batch is retried one image per request.
+
+    Args:
+        images: PIL Images or encoded image bytes to describe
+        model: Model name to use (must be a known Google model)
+        max_retries: Number of retry attempts per request
+        batch_size: Maximum number of images per request
+
+    Returns:
+        Markdown descriptions, in the same order as images
+
+    Raises:
+        VisionError: If an API call fails after retries
+    """
+    send = _gemini_sender(model)
+    return _describe_batched(images, send, "google", model, max_retries, batch_size)
+
+
+def describe_images_openrouter_batched(
+    images: list[ImageInput],
+    model: str,
+    max_retries: int = 3,
+    batch_size: int = OPENROUTER_BATCH_SIZE,
+) -> list[str]:
+    """Send several images to OpenRouter, up to batch_size per request.
+
+    Behaves like describe_images_google_batched().
+
+    Args:
+        images: PIL Images or encoded image bytes to describe
+        model: OpenRouter model name (must accept several images per message)
+        max_retries: Number of retry attempts per request
+        batch_size: Maximum number of images per request
+
+    Returns:
+        Markdown descriptions, in the same order as images
+
+    Raises:
+        VisionError: If an API call fails after retries
+    """
+    send = _openrouter_sender(model)
+    return _describe_batched(images, send, "openrouter", model, max_retries, batch_size)
+
+
+def _describe_batched(
+    images: list[ImageInput],
+    send: Callable[[list[bytes], int], str],
+    provider: str,
+    model: str,
+    max_retries: int,
+    batch_size: int,
+    max_workers: int = 1,
+) -> list[str]:
+    """Describe images in multi-image requests, up to max_workers in flight.
+
+    Text split out of a multi-image answer was written for the batch prompt,
+    so it is cached under its own key and only reused by later batches.
+    Identical images are sent once.
+    """
+    results: list[Optional[str]] = [None] * len(images)
+
+    def send_batch(batch: list[tuple[int, bytes, str, str]]) -> None:
+        texts = None
+        if len(batch) > 1:
+            text = send([data for _, data, _, _ in batch], max_retries)
+            texts = _split_batch_response(text, len(batch))
+        if texts is not None:
+            for (index, _, _, batch_key), text in zip(batch, texts):
+                _cache_put(batch_key, text)
+                results[index] = text
+            return
+        for index, data, cache_key, _ in batch:
+            results[index] = send([data], max_retries)
+            _cache_put(cache_key, results[index])
+
+    # Images are encoded here while earlier batches are sent by the pool,
+    # so encoding overlaps with waiting on the network
+    stop = threading.Event()
+    pool = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        # Group uncached images into batches by count and encoded size
+        futures = []
+        batch: list[tuple[int, bytes, str, str]] = []
+        batch_bytes = 0
+        first_index: dict[str, int] = {}  # cache key -> first image with it
+        copies: list[tuple[int, int]] = []  # (duplicate index, first index)
+        for index, image in enumerate(images):
+            data = _encode_image(image)
+            cache_key = _cache_key(data, provider, model, PROMPT)
+            if cache_key in first_index:
+                copies.append((index, first_index[cache_key]))
+                continue
+            first_index[cache_key] = index
+            batch_key = _cache_key(data, provider, model, PROMPT + BATCH_INSTRUCTIONS)
+            cached = _cache_get(cache_key) or _cache_get(batch_key)
+            if cached is not None:
+                results[index] = cached
+                continue
+            if batch and (len(batch) >= batch_size or batch_bytes + len(data) > _MAX_BATCH_BYTES):
+                futures.append(pool.submit(_run_cancellable, stop, send_batch, batch))
+                batch, batch_bytes = [], 0
+            batch.append((index, data, cache_key, batch_key))
+            batch_bytes += len(data)
+        if batch:
+            futures.append(pool.submit(_run_cancellable, stop, send_batch, batch))
+
+        for future in futures:
+            future.result()
+    except KeyboardInterrupt:
+        # Wake workers waiting to retry; queued batches are dropped below
+        stop.set()
+        raise
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    for index, first in copies:
+        results[index] = results[first]
+    return results
 
 
 def describe_image_openrouter(
-    image: Image.Image,
+    image: ImageInput,
     model: str,
     max_retries: int = 3,
 ) -> str:
     """Send image to OpenRouter and get description.
 
     Args:
-        image: PIL Image to describe
+        image: PIL Image or encoded image bytes to describe
         model: OpenRouter model name (e.g., "google/gemini-2.5-flash-lite")
         max_retries: Number of retry attempts on failure
 
@@ -278,96 +758,94 @@ def describe_image_openrouter(
     Raises:
         VisionError: If API call fails after retries
     """
-    api_key = get_openrouter_api_key()
-    image_b64 = image_to_base64(image)
+    send = _openrouter_sender(model)
 
-    # OpenRouter uses OpenAI-compatible format with base64 data URLs
-    payload = {
-        "model": model,
-        "messages": [
-            {
-                "role": "user",
-                "content": [
-                    {"type": "text", "text": PROMPT},
-                    {
-                        "type": "image_url",
-                        "image_url": {
-                            "url": f"data:image/png;base64,{image_b64}"
-                        }
-                    }
-                ]
-            }
-        ]
-    }
+    # Identical screenshots are answered from the cache
+    image_bytes = _encode_image(image)
+    cache_key = _cache_key(image_bytes, "openrouter", model, PROMPT)
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        return cached
 
-    headers = {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json",
-        "HTTP-Referer": "https://github.com/snag-cli/snag",
-        "X-Title": "Snag Screenshot Tool",
-    }
+    text = send([image_bytes], max_retries)
+    _cache_put(cache_key, text)
+    return text
 
-    # Retry with exponential backoff
-    last_error = None
-    for attempt in range(max_retries):
+
+def _openrouter_sender(model: str) -> Callable[[list[bytes], int], str]:
+    """Get the request function for an OpenRouter model.
+
+    Raises:
+        VisionError: If no API key is configured
+    """
+    return _build_openrouter_sender(model, get_openrouter_api_key())
+
+
+@functools.lru_cache(maxsize=16)
+def _build_openrouter_sender(model: str, api_key: str) -> Callable[[list[bytes], int], str]:
+    """Build a request function with the model's headers baked in."""
+    headers = {**_OPENROUTER_HEADERS, "Authorization": f"Bearer {api_key}"}
+
+    def send(images_bytes: list[bytes], max_retries: int) -> str:
+        """Send encoded images in one OpenRouter request and return the response text."""
+        template = _openrouter_template(model, len(images_bytes))
+        body = _json_body(template, *map(b64encode, images_bytes))
+
+        data = _post_with_retry(OPENROUTER_API_URL, body, headers, max_retries)
         try:
-            response = requests.post(
-                OPENROUTER_API_URL,
-                json=payload,
-                headers=headers,
-                timeout=60,
-            )
+            return data["choices"][0]["message"]["content"]
+        except (KeyError, IndexError) as e:
+            raise VisionError(f"Unexpected API response format: {e}")
 
-            if response.status_code == 200:
-                data = response.json()
-                try:
-                    return data["choices"][0]["message"]["content"]
-                except (KeyError, IndexError) as e:
-                    raise VisionError(f"Unexpected API response format: {e}")
-
-            elif response.status_code == 429:
-                # Rate limited, wait and retry
-                wait_time = 2 ** attempt
-                time.sleep(wait_time)
-                last_error = VisionError("Rate limited (429), retrying...")
-                continue
+    return send
 
-            else:
-                error_msg = response.text
-                try:
-                    error_data = response.json()
-                    if "error" in error_data:
-                        error_msg = error_data["error"].get("message", error_msg)
-                except Exception:
-                    pass
-                raise VisionError(
-                    f"API error ({response.status_code}): {error_msg}"
-                )
 
-        except requests.exceptions.Timeout:
-            last_error = VisionError("Request timed out")
-            wait_time = 2 ** attempt
-            time.sleep(wait_time)
-            continue
+def _get_zai_client(command: list[str], env: dict[str, str]) -> "MCPClient":
+    """Take an idle connected Z.AI client, or start a new one.
 
-        except requests.exceptions.RequestException as e:
-            last_error = VisionError(f"Network error: {e}")
-            wait_time = 2 ** attempt
-            time.sleep(wait_time)
-            continue
+    Raises:
+        MCPError: If the server cannot be started
+    """
+    from .mcp_client import MCPClient
 
-    raise last_error or VisionError("Failed after retries")
+    with _idle_zai_clients_lock:
+        while _idle_zai_clients:
+            client = _idle_zai_clients.pop()
+            if client.command == command and client.env == env and client.is_connected:
+                return client
+            client.disconnect()
+
+    client = MCPClient(command, env, timeout=120)
+    client.connect()
+    return client
+
+
+def _put_zai_client(client: "MCPClient") -> None:
+    """Keep a client whose last call completed for reuse, or shut it down."""
+    with _idle_zai_clients_lock:
+        if client.is_connected and len(_idle_zai_clients) < _MAX_IDLE_ZAI_CLIENTS:
+            _idle_zai_clients.append(client)
+            return
+    client.disconnect()
+
+
+@atexit.register
+def _close_zai_clients() -> None:
+    """Stop the idle Z.AI MCP servers."""
+    with _idle_zai_clients_lock:
+        while _idle_zai_clients:
+            _idle_zai_clients.pop().disconnect()
 
 
 def describe_image_zai(
-    image: Image.Image,
+    image: ImageInput,
     model: str = "glm-4.6v",
     max_retries: int = 3,
 ) -> str:
     """Send image to Z.AI via MCP and get description.
 
     Args:
-        image: PIL Image to describe
+        image: PIL Image or encoded image bytes to describe
         model: Model name (for consistency, Z.AI uses GLM-4.6V)
         max_retries: Number of retry attempts on failure
 
@@ -377,7 +855,7 @@ def describe_image_zai(
     Raises:
         VisionError: If MCP call fails after retries
     """
-    from .mcp_client import MCPClient, MCPError
+    from .mcp_client import MCPError
 
     # Check Node.js availability
     node_ok, node_msg = _check_node_version()
@@ -396,49 +874,87 @@ def describe_image_zai(
         "Z_AI_MODE": "ZAI",
     }
 
-    last_error = None
-    for attempt in range(max_retries):
-        try:
-            with MCPClient(command, env, timeout=120) as client:
-                # Save image to temp file (Z.AI expects file path)
-                with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
-                    temp_path = f.name
-                    image.save(temp_path, format="PNG")
+    # Same JPEG encoding as the other providers
+    image_bytes = _encode_image(image)
 
-                try:
-                    result = client.call_tool("analyze_image", {
-                        "image_source": temp_path,
-                        "prompt": ZAI_PROMPT,
-                    })
-                    return result
-                finally:
-                    Path(temp_path).unlink(missing_ok=True)
+    # Identical screenshots are answered from the cache
+    cache_key = _cache_key(image_bytes, "zai", model, ZAI_PROMPT)
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        return cached
+
+    # Save image to temp file (Z.AI expects file path), once for all attempts
+    fd, temp_path = tempfile.mkstemp(suffix=".jpg")
+    client = None
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(image_bytes)
+        del image_bytes
+
+        last_error = None
+        for attempt in range(max_retries):
+            try:
+                # Retries reuse the server process unless it has exited
+                if client is None or not client.is_connected:
+                    if client is not None:
+                        client.disconnect()
+                        client = None
+                    client = _get_zai_client(command, env)
+                result = client.call_tool("analyze_image", {
+                    "image_source": temp_path,
+                    "prompt": ZAI_PROMPT,
+                })
+                _cache_put(cache_key, result)
+                _put_zai_client(client)
+                client = None
+                return result
+
+            except MCPError as e:
+                last_error = VisionError(f"Z.AI MCP error: {e}")
+                if attempt < max_retries - 1:
+                    _wait_before_retry(_backoff(attempt))
+                continue
+
+            except Exception as e:
+                # The connection may be mid-message; don't reuse it
+                if client is not None:
+                    client.disconnect()
+                    client = None
+                last_error = VisionError(f"Z.AI error: {e}")
+                if attempt < max_retries - 1:
+                    _wait_before_retry(_backoff(attempt))
+                continue
 
-        except MCPError as e:
-            last_error = VisionError(f"Z.AI MCP error: {e}")
-            if attempt < max_retries - 1:
-                time.sleep(2 ** attempt)
-            continue
+        raise last_error or VisionError("Z.AI failed after retries")
+    finally:
+        # Only a client whose call completed goes back to the idle list
+        if client is not None:
+            client.disconnect()
+        Path(temp_path).unlink(missing_ok=True)
 
-        except Exception as e:
-            last_error = VisionError(f"Z.AI error: {e}")
-            if attempt < max_retries - 1:
-                time.sleep(2 ** attempt)
-            continue
 
-    raise last_error or VisionError("Z.AI failed after retries")
+# Provider name -> single-image describe function
+_PROVIDERS: dict[str, Callable[..., str]] = {
+    "google": describe_image_google,
+    "openrouter": describe_image_openrouter,
+    "zai": describe_image_zai,
+}
 
 
 def describe_image(
-    image: Image.Image,
+    image: ImageInput,
     model: str = DEFAULT_MODEL,
     provider: str = DEFAULT_PROVIDER,
     max_retries: int = 3,
 ) -> str:
     """Send image to vision API and get description.
 
+    Images larger than SNAG_MAX_IMAGE_EDGE (default 1568px) on their
+    longest edge are downscaled before upload. JPEG bytes within that
+    size are uploaded without being decoded and re-encoded.
+
     Args:
-        image: PIL Image to describe
+        image: PIL Image or encoded image bytes to describe
         model: Model name to use
         provider: Provider to use ("google", "openrouter", or "zai")
         max_retries: Number of retry attempts on failure
@@ -449,11 +965,120 @@ def describe_image(
     Raises:
         VisionError: If API call fails after retries
     """
-    if provider == "google":
-        return describe_image_google(image, model=model, max_retries=max_retries)
-    elif provider == "openrouter":
-        return describe_image_openrouter(image, model=model, max_retries=max_retries)
-    elif provider == "zai":
-        return describe_image_zai(image, model=model, max_retries=max_retries)
-    else:
-        raise VisionError(f"Unknown provider '{provider}'. Available: google, openrouter, zai")
+    describe = _PROVIDERS.get(provider)
+    if describe is None:
+        available = ", ".join(_PROVIDERS)
+        raise VisionError(f"Unknown provider '{provider}'. Available: {available}")
+    return describe(image, model=model, max_retries=max_retries)
+
+
+def describe_images(
+    images: list[ImageInput],
+    model: str = DEFAULT_MODEL,
+    provider: str = DEFAULT_PROVIDER,
+    max_retries: int = 3,
+    max_workers: int = 4,
+    batch_size: Optional[int] = None,
+) -> list[str]:
+    """Describe several images with batched, concurrent API requests.
+
+    Google and OpenRouter get several images per request (see
+    describe_images_google_batched()), saving a round trip per image.
+    Requests spend nearly all their time waiting on the network, so up to
+    max_workers of them are kept in flight at once and a batch takes about
+    as long as its slowest request rather than the sum of all of them.
+
+    Args:
+        images: PIL Images or encoded image bytes to describe
+        model: Model name to use
+        provider: Provider to use ("google", "openrouter", or "zai")
+        max_retries: Number of retry attempts per request
+        max_workers: Maximum number of concurrent requests
+        batch_size: Maximum number of images per request (default: the
+            provider's batch size; 1 sends one image per request)
+
+    Returns:
+        Markdown descriptions, in the same order as images
+
+    Raises:
+        VisionError: If any image fails after retries
+    """
+    if len(images) > 1 and batch_size != 1:
+        if provider == "google":
+            return _describe_batched(
+                images, _gemini_sender(model), provider, model, max_retries,
+                batch_size or GEMINI_BATCH_SIZE, max_workers,
+            )
+        elif provider == "openrouter":
+            return _describe_batched(
+                images, _openrouter_sender(model), provider, model, max_retries,
+                batch_size or OPENROUTER_BATCH_SIZE, max_workers,
+            )
+
+    if len(images) <= 1:
+        return [
+            describe_image(image, model=model, provider=provider, max_retries=max_retries)
+            for image in images
+        ]
+
+    results: list[Optional[str]] = [None] * len(images)
+    for index, text in describe_images_parallel(
+        images, model=model, provider=provider, max_retries=max_retries, max_workers=max_workers
+    ):
+        results[index] = text
+    return results
+
+
+def describe_images_parallel(
+    images: list[ImageInput],
+    model: str = DEFAULT_MODEL,
+    provider: str = DEFAULT_PROVIDER,
+    max_retries: int = 3,
+    max_workers: int = 4,
+) -> Iterator[tuple[int, str]]:
+    """Describe images one per request, concurrently, as results arrive.
+
+    Up to max_workers requests are in flight at once. Each time a request
+    is rate limited (429), that limit is halved for the rest of the run.
+
+    Args:
+        images: PIL Images or encoded image bytes to describe
+        model: Model name to use
+        provider: Provider to use ("google", "openrouter", or "zai")
+        max_retries: Number of retry attempts per image
+        max_workers: Maximum number of concurrent requests
+
+    Yields:
+        (index into images, markdown description), in completion order
+
+    Raises:
+        VisionError: If any image fails after retries
+    """
+    def describe(image: ImageInput) -> str:
+        return describe_image(image, model=model, provider=provider, max_retries=max_retries)
+
+    limit = max(1, min(max_workers, len(images)))
+    queued = enumerate(images)
+    running: dict = {}
+
+    stop = threading.Event()
+    _rate_limited.clear()
+    pool = ThreadPoolExecutor(max_workers=limit)
+    try:
+        while True:
+            if _rate_limited.is_set():
+                _rate_limited.clear()
+                limit = max(1, limit // 2)
+            for index, image in itertools.islice(queued, max(0, limit - len(running))):
+                running[pool.submit(_run_cancellable, stop, describe, image)] = index
+            if not running:
+                return
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield running.pop(future), future.result()
+    except KeyboardInterrupt:
+        # Wake workers waiting to retry; queued images are dropped below
+        stop.set()
+        raise
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
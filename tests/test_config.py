@@ -0,0 +1,59 @@
+"""Tests for the .env parser in snag.config."""
+
+import pytest
+
+from snag.config import parse_env_text
+
+
+@pytest.mark.parametrize(
+    ("line", "expected"),
+    [
+        ("KEY=abc", "abc"),
+        ("KEY = abc ", "abc"),
+        ("export KEY=abc", "abc"),
+        ('KEY="abc"', "abc"),
+        ("KEY='abc'", "abc"),
+        ('KEY="abc" # note', "abc"),
+        ("KEY='abc' # note", "abc"),
+        ("KEY=abc # note", "abc"),
+        ("KEY=abc#def", "abc#def"),
+        ('KEY="abc # not a comment"', "abc # not a comment"),
+        ('KEY="a\\"b\\\\c\\nd"', 'a"b\\c\nd'),
+        ("KEY='a\\'b\\n'", "a'b\\n"),
+        ("KEY=", ""),
+        ('KEY="abc"\r', "abc"),
+        ("KEY=abc\r", "abc"),
+    ],
+)
+def test_parse_env_value(line: str, expected: str) -> None:
+    assert parse_env_text(line + "\n") == {"KEY": expected}
+
+
+@pytest.mark.parametrize("line", ["KEY='abc\"", 'KEY="abc', "KEY='abc"])
+def test_parse_env_unterminated_quote_is_skipped(line: str) -> None:
+    assert parse_env_text(line + "\nOTHER=1\n") == {"OTHER": "1"}
+
+
+def test_parse_env_file() -> None:
+    text = (
+        "# API keys\n"
+        "\n"
+        'GEMINI_API_KEY="g-key" # from AI Studio\n'
+        "OPENROUTER_API_KEY=or-key\n"
+        "  # indented comment\n"
+        "Z_AI_API_KEY='z-key'\n"
+    )
+    assert parse_env_text(text) == {
+        "GEMINI_API_KEY": "g-key",
+        "OPENROUTER_API_KEY": "or-key",
+        "Z_AI_API_KEY": "z-key",
+    }
+
+
+def test_parse_env_multiline_quoted_value() -> None:
+    text = 'CERT="line one\nline two"\nNEXT=value\n'
+    assert parse_env_text(text) == {"CERT": "line one\nline two", "NEXT": "value"}
+
+
+def test_parse_env_later_line_wins() -> None:
+    assert parse_env_text("KEY=first\nKEY=second\n") == {"KEY": "second"}
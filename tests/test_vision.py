@@ -0,0 +1,124 @@
+"""Tests for batched image descriptions in snag.vision."""
+
+import base64
+import json
+from io import BytesIO
+from typing import Optional
+
+import pytest
+from PIL import Image
+
+from snag import vision
+
+
+def make_jpeg(color: str) -> bytes:
+    buffer = BytesIO()
+    Image.new("RGB", (8, 8), color).save(buffer, format="JPEG")
+    return buffer.getvalue()
+
+
+class FakeResponse:
+    def __init__(self, text: str) -> None:
+        self.status_code = 200
+        self.headers: dict[str, str] = {}
+        self.content = json.dumps(
+            {"candidates": [{"content": {"parts": [{"text": text}]}}]}
+        ).encode()
+
+
+@pytest.fixture
+def api(monkeypatch, tmp_path):
+    """Answer Gemini requests from a list of texts and record the request bodies."""
+    monkeypatch.setattr(vision, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(vision, "_memo", {})
+    monkeypatch.setattr(vision, "get_gemini_api_key", lambda: "test-key")
+    monkeypatch.delenv("SNAG_NO_CACHE", raising=False)
+
+    replies: list[str] = []
+    bodies: list[bytes] = []
+
+    def post(url, data, headers, timeout):
+        bodies.append(data)
+        return FakeResponse(replies.pop(0))
+
+    monkeypatch.setattr(vision._session, "post", post)
+    return replies, bodies
+
+
+def images_in(body: bytes, *images: bytes) -> list[bool]:
+    return [base64.b64encode(image) in body for image in images]
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("===IMAGE 1===\nfirst\n===IMAGE 2===\nsecond\n", ["first", "second"]),
+        ("===IMAGE 1===  \n\nfirst\n\n===IMAGE 2===\nsecond", ["first", "second"]),
+        ("===IMAGE 1===\na ===IMAGE 2=== b\n===IMAGE 2===\nc", ["a ===IMAGE 2=== b", "c"]),
+        ("===IMAGE 1===\nfirst\n", None),
+        ("first\nsecond\n", None),
+        ("===IMAGE 2===\nsecond\n===IMAGE 1===\nfirst\n", None),
+        ("===IMAGE 1===\na\n===IMAGE 2===\nb\n===IMAGE 3===\nc\n", None),
+    ],
+)
+def test_split_batch_response(text: str, expected: Optional[list[str]]) -> None:
+    assert vision._split_batch_response(text, 2) == expected
+
+
+def test_batch_is_split_per_image(api) -> None:
+    replies, bodies = api
+    red, blue = make_jpeg("red"), make_jpeg("blue")
+    replies.append("===IMAGE 1===\nred text\n===IMAGE 2===\nblue text\n")
+
+    assert vision.describe_images([red, blue]) == ["red text", "blue text"]
+    assert len(bodies) == 1
+    assert images_in(bodies[0], red, blue) == [True, True]
+
+
+@pytest.mark.parametrize(
+    "bad_reply",
+    [
+        "red text and blue text",
+        "===IMAGE 1===\nred text\n",
+        "===IMAGE 2===\nblue text\n===IMAGE 1===\nred text\n",
+    ],
+)
+def test_bad_markers_fall_back_to_single_requests(api, bad_reply: str) -> None:
+    replies, bodies = api
+    red, blue = make_jpeg("red"), make_jpeg("blue")
+    replies.extend([bad_reply, "red text", "blue text"])
+
+    assert vision.describe_images([red, blue]) == ["red text", "blue text"]
+    assert len(bodies) == 3
+    assert images_in(bodies[1], red, blue) == [True, False]
+    assert images_in(bodies[2], red, blue) == [False, True]
+
+
+def test_split_answers_are_cached_for_batches_only(api) -> None:
+    replies, bodies = api
+    red, blue = make_jpeg("red"), make_jpeg("blue")
+    replies.append("===IMAGE 1===\nred text\n===IMAGE 2===\nblue text\n")
+    vision.describe_images([red, blue])
+
+    # A later batch reuses the split answers without a request
+    assert vision.describe_images([red, blue]) == ["red text", "blue text"]
+    assert len(bodies) == 1
+
+    # A single-image request was never answered for the single prompt
+    replies.append("red alone")
+    assert vision.describe_image(red) == "red alone"
+    assert len(bodies) == 2
+
+    # Batches still find answers cached under the single-image key
+    assert vision.describe_images([red, blue]) == ["red alone", "blue text"]
+    assert len(bodies) == 2
+
+
+def test_identical_images_are_sent_once(api) -> None:
+    replies, bodies = api
+    red, blue = make_jpeg("red"), make_jpeg("blue")
+    replies.append("===IMAGE 1===\nred text\n===IMAGE 2===\nblue text\n")
+
+    assert vision.describe_images([red, blue, red]) == ["red text", "blue text", "red text"]
+    assert len(bodies) == 1
+    assert bodies[0].count(base64.b64encode(red)) == 1